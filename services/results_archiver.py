@@ -23,7 +23,7 @@ import json
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from datetime import datetime, timezone
 
 from config.settings import config
@@ -319,25 +319,47 @@ class ResultsArchiver:
         """Resolve an analysis file from archives for this video.
         Prefers exact hash dir; falls back to any file matching the stem in project archives.
         """
+        return ResultsArchiver.find_analysis_files(project_name, video_path, (suffix,)).get(suffix)
+
+    @staticmethod
+    def find_analysis_files(
+        project_name: str,
+        video_path: Path,
+        suffixes: Iterable[str],
+    ) -> dict[str, Path]:
+        """Resolve several analysis files from archives for this video in one lookup.
+
+        Same resolution as `find_analysis_file`, but the video is hashed once and each
+        archive project directory is walked once for all suffixes. Returns {suffix: path}
+        for the suffixes found.
+        """
+        found: dict[str, Path] = {}
         try:
             video_hash = ResultsArchiver.compute_video_hash(video_path)
             video_stem = video_path.stem
+            wanted = {f"{video_stem}{suffix}": suffix for suffix in suffixes}
 
             # Try exact-hash directory
             if video_hash:
                 ap = ResultsArchiver.get_archive_paths(project_name, video_hash)
-                candidate = ap.video_hash_dir / f"{video_stem}{suffix}"
-                if candidate.exists():
-                    return candidate
+                for name, suffix in wanted.items():
+                    candidate = ap.video_hash_dir / name
+                    if candidate.exists():
+                        found[suffix] = candidate
 
             # Fallback: search by stem within project archive
-            matches = ResultsArchiver._list_matching_project_dirs(project_name)
-            for project_arch in matches:
-                for p in project_arch.rglob(f"{video_stem}{suffix}"):
-                    return p
+            missing = {name: suffix for name, suffix in wanted.items() if suffix not in found}
+            if missing:
+                for project_arch in ResultsArchiver._list_matching_project_dirs(project_name):
+                    for p in project_arch.rglob(f"{video_stem}*"):
+                        suffix = missing.pop(p.name, None)
+                        if suffix is not None:
+                            found[suffix] = p
+                    if not missing:
+                        break
         except Exception:
             pass
-        return None
+        return found
 
     @staticmethod
     def project_has_analysis(project_name: str) -> Tuple[bool, bool, bool]:
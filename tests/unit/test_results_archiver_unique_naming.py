@@ -92,3 +92,43 @@ def test_find_analysis_file_reads_from_timestamped_archives(tmp_path, monkeypatc
     found = results_archiver.ResultsArchiver.find_analysis_file(base_project, video_path, results_archiver.SCENES_SUFFIX)
     assert found is not None
     assert found.name == 'clipA_scenes.csv'
+
+
+def test_find_analysis_files_hashes_video_once_for_all_suffixes(tmp_path, monkeypatch):
+    from config.settings import config as app_config
+    monkeypatch.setattr(app_config, 'ARCHIVES_DIR', tmp_path / 'archives')
+
+    base_project = "14 Camille"
+    video_dir = tmp_path / 'dummy_project'
+    video_dir.mkdir(parents=True, exist_ok=True)
+    video_path = video_dir / 'video1.mp4'
+    video_path.write_bytes(b"fake-video-content")
+    scenes = video_dir / 'video1_scenes.csv'
+    scenes.write_text('t;scene', encoding='utf-8')
+    tracking = video_dir / 'video1_tracking.json'
+    tracking.write_text('{"tracks":[]}', encoding='utf-8')
+    results_archiver.ResultsArchiver.archive_analysis_files(
+        base_project, video_path, scenes_file=scenes, tracking_file=tracking
+    )
+
+    hash_calls = []
+    real_hash = results_archiver.ResultsArchiver.compute_video_hash
+
+    def _counting_hash(path, *args, **kwargs):
+        hash_calls.append(path)
+        return real_hash(path, *args, **kwargs)
+
+    monkeypatch.setattr(results_archiver.ResultsArchiver, 'compute_video_hash', staticmethod(_counting_hash))
+
+    found = results_archiver.ResultsArchiver.find_analysis_files(
+        base_project,
+        video_path,
+        (results_archiver.SCENES_SUFFIX, results_archiver.AUDIO_SUFFIX, results_archiver.TRACKING_SUFFIX),
+    )
+
+    assert len(hash_calls) == 1
+    assert set(found) == {results_archiver.SCENES_SUFFIX, results_archiver.TRACKING_SUFFIX}
+    assert found[results_archiver.TRACKING_SUFFIX].read_text(encoding='utf-8') == '{"tracks":[]}'
+    assert results_archiver.ResultsArchiver.find_analysis_file(
+        base_project, video_path, results_archiver.AUDIO_SUFFIX
+    ) is None
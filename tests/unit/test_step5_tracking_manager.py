@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import importlib.util
+import io
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+
+
+def _load_manager_module():
+    project_root = Path(__file__).resolve().parents[2]
+    module_path = project_root / 'workflow_scripts' / 'step5' / 'run_tracking_manager.py'
+    spec = importlib.util.spec_from_file_location('workflow_scripts.step5.run_tracking_manager_test', module_path)
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _make_venv_python(venv_dir: Path) -> Path:
+    python_version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    (venv_dir / 'bin').mkdir(parents=True)
+    (venv_dir / 'lib' / python_version / 'site-packages').mkdir(parents=True)
+    return venv_dir / 'bin' / 'python'
+
+
+class TestStep5ManagerCudaPaths:
+    def test_build_venv_cuda_paths_returns_empty_without_nvidia_dir(self, tmp_path):
+        mod = _load_manager_module()
+
+        # Given: a venv without nvidia wheels
+        python_exe = _make_venv_python(tmp_path / 'venv')
+
+        # When:  Operation to execute
+        paths = mod._build_venv_cuda_paths(python_exe)
+
+        # Then:  Expected result/verification
+        assert paths == []
+
+    def test_build_venv_cuda_paths_keeps_declared_order_and_skips_missing_libs(self, tmp_path):
+        mod = _load_manager_module()
+
+        # Given: a venv with some nvidia packages, one of them without its lib dir
+        python_exe = _make_venv_python(tmp_path / 'venv')
+        site_packages = python_exe.parent.parent / 'lib' / f"python{sys.version_info.major}.{sys.version_info.minor}" / 'site-packages'
+        nvidia_dir = site_packages / 'nvidia'
+        (nvidia_dir / 'cudnn' / 'lib').mkdir(parents=True)
+        (nvidia_dir / 'cublas' / 'lib').mkdir(parents=True)
+        (nvidia_dir / 'cufft').mkdir(parents=True)
+
+        # When:  Operation to execute
+        paths = mod._build_venv_cuda_paths(python_exe)
+
+        # Then:  Expected result/verification
+        assert paths == [str(nvidia_dir / 'cublas' / 'lib'), str(nvidia_dir / 'cudnn' / 'lib')]
+
+
+class TestStep5ManagerLogReader:
+    def test_log_reader_thread_parses_binary_progress_lines(self, capsys):
+        mod = _load_manager_module()
+
+        # Given: a worker emitting binary stdout with a progress line
+        class _FakeProcess:
+            stdout = io.BytesIO(b"Loading models...\n[Progression]|42|10|24\n[Progression]|oops|1|2\nnot parsed \xff\n")
+
+        progress_map = {}
+
+        # When:  Operation to execute
+        mod.log_reader_thread(_FakeProcess(), 'clip.mp4', progress_map, threading.Lock())
+
+        # Then:  Expected result/verification
+        assert progress_map == {'clip.mp4': '42%'}
+        assert 'clip.mp4: 42%' in capsys.readouterr().out
+        assert _FakeProcess.stdout.closed
+
+
+class TestStep5ManagerSubprocessEnv:
+    def test_build_subprocess_env_applies_defaults_without_overriding_environ(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: an inherited OMP_NUM_THREADS and no CUDA libs for the worker
+        monkeypatch.setitem(mod._BASE_SUBPROCESS_ENV, 'OMP_NUM_THREADS', '4')
+        monkeypatch.setattr(mod, '_collect_cuda_lib_paths', lambda *_args: [])
+
+        # When:  Operation to execute
+        env = mod._build_subprocess_env(tmp_path / 'python', '')
+
+        # Then:  Expected result/verification
+        assert env['OMP_NUM_THREADS'] == '4'
+        assert env['MKL_NUM_THREADS'] == '1'
+        assert env is not mod._BASE_SUBPROCESS_ENV
+
+    def test_build_subprocess_env_prepends_cuda_paths(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: CUDA libs discovered for the worker and an existing LD_LIBRARY_PATH
+        monkeypatch.setitem(mod._BASE_SUBPROCESS_ENV, 'LD_LIBRARY_PATH', '/opt/lib')
+        monkeypatch.setattr(
+            mod, '_collect_cuda_lib_paths', lambda *_args: ['/venv/nvidia/cublas/lib', '/venv/nvidia/cudnn/lib']
+        )
+
+        # When:  Operation to execute
+        env = mod._build_subprocess_env(tmp_path / 'python', 'insightface')
+
+        # Then:  Expected result/verification
+        assert env['LD_LIBRARY_PATH'] == '/venv/nvidia/cublas/lib:/venv/nvidia/cudnn/lib:/opt/lib'
+        assert 'LD_LIBRARY_PATH' not in mod._DEFAULT_SUBPROCESS_ENV
+
+    def test_discover_system_cuda_lib_paths_caches_hits_and_retries_misses(self, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: a probe that finds nothing first, then CUDA once installed
+        results = [[], ['/usr/local/cuda/lib64']]
+        calls = []
+
+        def _fake_probe(env):
+            calls.append(env)
+            return results[len(calls) - 1]
+
+        clock = [1000.0]
+        monkeypatch.setattr(mod, '_probe_system_cuda_lib_paths', _fake_probe)
+        monkeypatch.setattr(mod.time, 'monotonic', lambda: clock[0])
+
+        # When:  Operation to execute
+        first = mod._discover_system_cuda_lib_paths(mod.ENV)
+        second = mod._discover_system_cuda_lib_paths(mod.ENV)
+        clock[0] += mod.SYSTEM_CUDA_RETRY_SECONDS + 1
+        third = mod._discover_system_cuda_lib_paths(mod.ENV)
+        clock[0] += mod.SYSTEM_CUDA_RETRY_SECONDS + 1
+        fourth = mod._discover_system_cuda_lib_paths(mod.ENV)
+
+        # Then:  Expected result/verification
+        assert first == [] and second == []
+        assert third == fourth == ['/usr/local/cuda/lib64']
+        assert len(calls) == 2
+
+
+class TestStep5ManagerVideosJson:
+    def test_load_videos_json_without_orjson(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: a legacy manifest and orjson unavailable
+        manifest = tmp_path / 'videos.json'
+        manifest.write_text('{"videos": ["/data/a.mp4", "/data/b.mov"]}', encoding='utf-8')
+        monkeypatch.setattr(mod, 'orjson', None)
+
+        # When:  Operation to execute
+        data = mod._load_videos_json(manifest)
+
+        # Then:  Expected result/verification
+        assert data == {'videos': ['/data/a.mp4', '/data/b.mov']}
+
+
+class TestStep5ManagerEngineCapabilities:
+    def test_engine_capabilities_reserve_gpu_only_mode_for_insightface(self):
+        mod = _load_manager_module()
+
+        # When:  Operation to execute
+        gpu_only = {name for name, caps in mod.ENGINE_CAPABILITIES.items() if caps.gpu_only}
+        cpu_only = {name for name, caps in mod.ENGINE_CAPABILITIES.items() if caps.cpu_only}
+
+        # Then:  Expected result/verification
+        assert gpu_only == {'insightface'}
+        assert cpu_only == {'opencv_haar', 'opencv_yunet', 'eos'}
+        assert mod.ENGINE_CAPABILITIES[''].gpu_capable is True
+        assert mod.DEFAULT_ENGINE_CAPS.gpu_capable is False
+
+    def test_normalize_engine_maps_mediapipe_aliases_to_default(self):
+        mod = _load_manager_module()
+
+        # Then:  Expected result/verification
+        assert mod._normalize_engine(None) == ''
+        assert mod._normalize_engine(' MediaPipe_Landmarker ') == ''
+        assert mod._normalize_engine('mediapipe') == ''
+        assert mod._normalize_engine('InsightFace') == 'insightface'
+        assert mod._normalize_engine('custom_engine') == 'custom_engine'
+
+
+class TestStep5ManagerWorkerCommand:
+    def test_launch_worker_process_builds_cpu_command_line(self, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: Popen captured instead of spawning a worker
+        captured = {}
+
+        def _fake_popen(command_args, **kwargs):
+            captured['args'] = command_args
+            captured['kwargs'] = kwargs
+            return object()
+
+        monkeypatch.setattr(mod.subprocess, 'Popen', _fake_popen)
+        monkeypatch.setattr(mod, '_build_subprocess_env', lambda *_args: {})
+
+        # When:  Operation to execute
+        mod.launch_worker_process('/videos/clip.mp4', use_gpu=False, internal_workers=4)
+
+        # Then:  Expected result/verification
+        args = captured['args']
+        assert args[1] == str(mod.WORKER_SCRIPTS['multi'])
+        assert args[args.index('--models_dir') + 1] == str(mod.MODELS_DIR)
+        assert '--use_gpu' not in args
+        assert '--mp_landmarker_output_blendshapes' in args
+        assert 'True' not in args
+        assert args[args.index('--mp_landmarker_min_tracking_confidence') + 1] == '0.3'
+        assert args[args.index('--mp_num_workers_internal') + 1] == '4'
+        assert args[-2:] == ['--chunk_size', '0']
+        assert 'text' not in captured['kwargs']
+
+
+class TestStep5ManagerMonitorProgress:
+    def test_monitor_progress_prints_only_changed_lines(self, monkeypatch, capsys):
+        mod = _load_manager_module()
+
+        # Given: one running job whose progress changes once over four ticks
+        class _Proc:
+            def __init__(self):
+                self.polls = 0
+
+            def poll(self):
+                self.polls += 1
+                return None if self.polls <= 4 else 0
+
+        progress_map = {'clip.mp4': '10%'}
+        updates = iter([None, '20%', None, None])
+
+        def _fake_sleep(_seconds):
+            status = next(updates, None)
+            if status:
+                progress_map['clip.mp4'] = status
+
+        monkeypatch.setattr(mod.time, 'sleep', _fake_sleep)
+
+        # When:  Operation to execute
+        mod.monitor_progress({'clip.mp4': _Proc()}, progress_map, threading.Lock(), 1)
+
+        # Then:  Expected result/verification
+        lines = [l for l in capsys.readouterr().out.splitlines() if l.startswith('[Progression-MultiLine]')]
+        assert lines == ['[Progression-MultiLine]clip.mp4: 10%', '[Progression-MultiLine]clip.mp4: 20%']
+
+
+
+class TestStep5ManagerSystemCudaProbe:
+    def test_probe_system_cuda_lib_paths_honours_explicit_paths(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: STEP5_CUDA_LIB_PATH listing one existing and one missing dir
+        existing = tmp_path / 'cuda' / 'lib64'
+        existing.mkdir(parents=True)
+        env = mod._EnvConfig({'STEP5_CUDA_LIB_PATH': f"{existing}:{tmp_path / 'missing'}"})
+
+        # When:  Operation to execute
+        paths = mod._probe_system_cuda_lib_paths(env)
+
+        # Then:  Expected result/verification
+        assert paths == [str(existing)]
+
+    def test_probe_system_cuda_lib_paths_scans_cuda_home(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: a CUDA_HOME with both lib layouts and no system defaults
+        cuda_home = tmp_path / 'cuda'
+        (cuda_home / 'lib64').mkdir(parents=True)
+        (cuda_home / 'targets' / 'x86_64-linux' / 'lib').mkdir(parents=True)
+        monkeypatch.setattr(mod, 'SYSTEM_CUDA_DEFAULTS', [])
+        env = mod._EnvConfig({'CUDA_HOME': str(cuda_home)})
+
+        # When:  Operation to execute
+        paths = mod._probe_system_cuda_lib_paths(env)
+
+        # Then:  Expected result/verification
+        assert paths[:2] == [str(cuda_home / 'lib64'), str(cuda_home / 'targets' / 'x86_64-linux' / 'lib')]
+
+
+class TestStep5ManagerScheduler:
+    def test_resource_worker_loop_stops_pulling_when_stop_event_is_set(self, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: a queue of three videos and a stop request after the first job
+        stop_event = threading.Event()
+        ran = []
+
+        def _fake_run(job_info, *_args):
+            ran.append(job_info['path'])
+            stop_event.set()
+
+        monkeypatch.setattr(mod, 'run_job_and_monitor', _fake_run)
+        monkeypatch.setattr(mod, 'CPU_INTERNAL_WORKERS', 1, raising=False)
+        videos = deque(['/v/a.mp4', '/v/b.mp4', '/v/c.mp4'])
+
+        # When:  Operation to execute
+        mod.resource_worker_loop('CPU', False, videos, threading.Lock(), {}, {}, threading.Lock(), stop_event)
+
+        # Then:  Expected result/verification
+        assert ran == ['/v/a.mp4']
+        assert list(videos) == ['/v/b.mp4', '/v/c.mp4']
+
+    def test_main_terminates_running_workers_on_keyboard_interrupt(self, tmp_path, monkeypatch):
+        mod = _load_manager_module()
+
+        # Given: one CPU video whose worker runs until terminated, and a Ctrl+C while waiting
+        manifest = tmp_path / 'videos.json'
+        manifest.write_text('["/v/a.mp4", "/v/b.mp4"]', encoding='utf-8')
+
+        class _BlockingProc:
+            def __init__(self):
+                self.terminated = threading.Event()
+                self.returncode = None
+
+            def poll(self):
+                return self.returncode
+
+            def terminate(self):
+                self.returncode = -15
+                self.terminated.set()
+
+            def wait(self):
+                self.terminated.wait(10)
+
+        launched = []
+        started = threading.Event()
+
+        def _fake_run(job_info, processes, _progress_map, lock):
+            proc = _BlockingProc()
+            with lock:
+                processes[Path(job_info['path']).name] = proc
+            launched.append(proc)
+            started.set()
+            proc.wait()
+
+        def _interrupted_wait(*_args, **_kwargs):
+            started.wait(10)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(mod, 'run_job_and_monitor', _fake_run)
+        monkeypatch.setattr(mod, 'wait', _interrupted_wait)
+        monkeypatch.setattr(mod.time, 'sleep', lambda _seconds: None)
+        monkeypatch.setattr(sys, 'argv', ['run_tracking_manager.py', '--videos_json_path', str(manifest), '--disable_gpu'])
+
+        # When:  Operation to execute
+        try:
+            mod.main()
+        except KeyboardInterrupt:
+            interrupted = True
+        else:
+            interrupted = False
+
+        # Then:  Expected result/verification
+        assert interrupted
+        assert len(launched) == 1
+        assert launched[0].terminated.is_set()
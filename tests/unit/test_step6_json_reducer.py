@@ -1,5 +1,6 @@
 import importlib.util
 import json
+import sys
 from pathlib import Path
 
 import pytest
@@ -332,3 +333,609 @@ def test_process_directory_without_audio_does_not_crash(tmp_path: Path):
     reduced = json.loads(tracking_out.read_text(encoding="utf-8"))
     assert isinstance(reduced.get("frames_analysis"), list)
     assert "temporal_alignment" not in reduced
+
+
+def test_load_json_and_atomic_write_roundtrip_without_orjson(tmp_path: Path, monkeypatch):
+    # Given: orjson unavailable and a payload with non-ASCII text
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setattr(mod, "orjson", None)
+
+    payload = {"frames_analysis": [{"frame": 1, "label": "visage é"}], "fps": 25.0}
+    out_path = tmp_path / "clip_tracking.json"
+
+    # When: writing then reading back
+    mod._write_json_atomically(out_path, payload)
+    loaded = mod._load_json(out_path)
+
+    # Then: content roundtrips and no temp file is left behind
+    assert loaded == payload
+    assert "visage é" in out_path.read_text(encoding="utf-8")
+    assert not (tmp_path / "clip_tracking.json.tmp").exists()
+
+
+def test_stream_reduce_video_json_matches_in_memory_reduction(tmp_path: Path, monkeypatch):
+    # Given: a raw tracking JSON with metadata after the frames array
+    pytest.importorskip("ijson")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setattr(mod, "_STREAMING_MIN_BYTES", 0)
+
+    raw = {
+        "frames": [
+            {
+                "frame": 1,
+                "tracked_objects": [
+                    {
+                        "id": "face_1",
+                        "centroid_x": 12.5,
+                        "source": "face_landmarker",
+                        "label": "face",
+                        "confidence": 0.8,
+                        "bbox_width": 4,
+                        "bbox_height": 6,
+                        "landmarks": [[1.0, 2.0], [3.0, 4.0]],
+                        "speaking_sources": {"audio": {"active_speakers": ["spkA"]}},
+                    }
+                ],
+            },
+            {"frame": 2, "tracked_objects": None},
+        ],
+        "metadata": {"fps": 29.97, "total_frames": 3},
+    }
+    tracking_path = tmp_path / "clip.json"
+    _write_json(tracking_path, raw)
+
+    # When: reducing via the streaming loader
+    streamed = mod._load_and_reduce_video_json(tracking_path)
+
+    # Then: the result is identical to the in-memory reduction
+    assert streamed == mod.reduce_video_json(raw)
+    assert streamed["fps"] == 29.97 and streamed["total_frames"] == 3
+
+
+def test_stream_reduce_video_json_handles_reduced_schema(tmp_path: Path, monkeypatch):
+    # Given: an already reduced tracking JSON
+    pytest.importorskip("ijson")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setattr(mod, "_STREAMING_MIN_BYTES", 0)
+
+    reduced = {
+        "fps": 25.0,
+        "frames_analysis": [{"frame": 7, "tracked_objects": [{"id": "o", "active_speakers": ["S1"]}]}],
+    }
+    tracking_path = tmp_path / "clip_tracking.json"
+    _write_json(tracking_path, reduced)
+
+    # When: reducing via the streaming loader
+    streamed = mod._load_and_reduce_video_json(tracking_path)
+
+    # Then: the result is identical to the in-memory reduction
+    assert streamed == mod.reduce_video_json(reduced)
+    assert streamed["total_frames"] == 7
+
+
+def test_load_and_reduce_video_json_loads_reduced_tracking_in_memory(tmp_path: Path, monkeypatch):
+    # Given: a large (per threshold) tracking JSON that is already reduced
+    ijson = pytest.importorskip("ijson")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setattr(mod, "_STREAMING_MIN_BYTES", 0)
+
+    reduced = {
+        "frames_analysis": [{"frame": 7, "tracked_objects": [{"id": "o", "active_speakers": ["S1"]}]}],
+        "fps": 25.0,
+    }
+    tracking_path = tmp_path / "clip_tracking.json"
+    _write_json(tracking_path, reduced)
+
+    def _no_object_builder(*_args, **_kwargs):
+        raise AssertionError("reduced frames must not be rebuilt by ijson")
+
+    monkeypatch.setattr(ijson, "ObjectBuilder", _no_object_builder)
+
+    # When: reducing via the size-dispatching loader
+    result = mod._load_and_reduce_video_json(tracking_path)
+
+    # Then: the file is loaded in one go and reduced as in memory
+    assert result == mod.reduce_video_json(reduced)
+
+
+def test_stream_reduce_audio_json_matches_in_memory_reduction(tmp_path: Path, monkeypatch):
+    # Given: a raw audio JSON with silent frames, speakers and metadata after the frames
+    pytest.importorskip("ijson")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setattr(mod, "_STREAMING_MIN_BYTES", 0)
+
+    raw = {
+        "frames_analysis": [
+            {
+                "frame": 1,
+                "audio_info": {
+                    "is_speech_present": True,
+                    "active_speaker_labels": ["spkA", "spkB"],
+                    "timecode_sec": 0.04,
+                    "raw_scores": [0.1, 0.9],
+                },
+            },
+            {"frame": 2, "audio_info": None},
+            {"frame": 3, "audio_info": {"is_speech_present": False}},
+        ],
+        "metadata": {"fps": 25, "total_frames": 3},
+    }
+    audio_path = tmp_path / "clip_audio.json"
+    _write_json(audio_path, raw)
+
+    # When: reducing via the streaming loader
+    streamed = mod._load_and_reduce_audio_json(audio_path)
+
+    # Then: the result is identical to the in-memory reduction
+    assert streamed == mod.reduce_audio_json(raw)
+    assert streamed["speaker_stats"]["speaker_frame_counts"] == {"spkA": 1, "spkB": 1}
+
+
+def test_process_directory_in_process_pool_reduces_every_project(tmp_path: Path, monkeypatch, capsys):
+    # Given: three independent projects, reduced with two worker processes
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "workflow_scripts" / "step6" / "json_reducer.py"
+    spec = importlib.util.spec_from_file_location("step6_json_reducer_pool_test", module_path)
+    mod = importlib.util.module_from_spec(spec)
+    # Registered so that worker processes can unpickle process_project_folder.
+    monkeypatch.setitem(sys.modules, "step6_json_reducer_pool_test", mod)
+    spec.loader.exec_module(mod)  # type: ignore[union-attr]
+
+    for name in ("Camille A", "Camille B", "Camille C"):
+        docs_dir = tmp_path / name / "docs"
+        docs_dir.mkdir(parents=True)
+        (docs_dir / "clip.mp4").write_bytes(b"")
+        _write_json(docs_dir / "clip.json", {"fps": 25, "frames": [{"frame": 1, "tracked_objects": []}]})
+
+    # When: running directory processing with a pool
+    mod.process_directory(str(tmp_path), keyword="Camille", max_workers=2)
+
+    # Then: every project is reduced and progress is reported once per project
+    for name in ("Camille A", "Camille B", "Camille C"):
+        reduced = json.loads((tmp_path / name / "docs" / "clip_tracking.json").read_text(encoding="utf-8"))
+        assert reduced["total_frames"] == 1
+    out = capsys.readouterr().out
+    assert sorted(line.split(": ", 2)[1] for line in out.splitlines() if line.startswith("REDUCING_JSON:")) == [
+        "1/3",
+        "2/3",
+        "3/3",
+    ]
+
+
+def test_process_directory_pipelines_several_videos_of_one_project(tmp_path: Path):
+    # Given: one project with three videos, each with tracking and audio JSONs
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    docs_dir = tmp_path / "Camille Pipeline" / "docs"
+    docs_dir.mkdir(parents=True)
+    for i in range(1, 4):
+        (docs_dir / f"clip{i}.mp4").write_bytes(b"")
+        _write_json(docs_dir / f"clip{i}.json", {"fps": 25, "total_frames": i, "frames": []})
+        _write_json(
+            docs_dir / f"clip{i}_audio.json",
+            {"fps": 25, "total_frames": i, "frames_analysis": [{"frame": 1, "audio_info": {"is_speech_present": True}}]},
+        )
+
+    # When: running directory processing
+    mod.process_directory(str(tmp_path), keyword="Camille")
+
+    # Then: every tracking and audio file has been reduced and written
+    for i in range(1, 4):
+        tracking = json.loads((docs_dir / f"clip{i}_tracking.json").read_text(encoding="utf-8"))
+        assert tracking["total_frames"] == i
+        assert tracking["temporal_alignment"]["audio_total_frames"] == i
+        audio = json.loads((docs_dir / f"clip{i}_audio.json").read_text(encoding="utf-8"))
+        assert audio["frames_analysis"] == [
+            {"frame": 1, "audio_info": {"is_speech_present": True, "active_speaker_labels": []}}
+        ]
+    assert not list(docs_dir.glob("*.tmp"))
+
+
+def test_write_json_atomically_keeps_target_and_removes_tmp_on_failure(tmp_path: Path, monkeypatch):
+    # Given: an existing JSON file and a serializer that fails mid-write
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    target = tmp_path / "clip_audio.json"
+    _write_json(target, {"frames_analysis": []})
+
+    def failing_dumps(payload, pretty=False):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(mod, "_dumps_json", failing_dumps)
+
+    # When: writing new content atomically
+    with pytest.raises(TypeError):
+        mod._write_json_atomically(target, {"frames_analysis": [1]})
+
+    # Then: the original content is intact and no temporary file is left behind
+    assert json.loads(target.read_text(encoding="utf-8")) == {"frames_analysis": []}
+    assert not (tmp_path / "clip_audio.json.tmp").exists()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_is_compact_unless_pretty(monkeypatch, use_orjson: bool):
+    # Given: the serializer with or without orjson
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    if not use_orjson:
+        monkeypatch.setattr(mod, "orjson", None)
+    elif mod.orjson is None:
+        pytest.skip("orjson not installed")
+    payload = {"frames_analysis": [{"frame": 1, "label": "visage é"}]}
+
+    # When: serializing in compact and pretty modes
+    compact = mod._dumps_json(payload)
+    pretty = mod._dumps_json(payload, pretty=True)
+
+    # Then: both decode to the payload, only pretty output is indented
+    assert json.loads(compact) == json.loads(pretty) == payload
+    assert b"\n" not in compact and b" " not in compact.replace("visage é".encode("utf-8"), b"")
+    assert b'\n  "frames_analysis"' in pretty
+
+
+@pytest.mark.parametrize("flag, expected", [([], True), (["--no-pretty"], False)])
+def test_main_pretty_flag_overrides_json_reducer_pretty_env(tmp_path: Path, monkeypatch, flag, expected):
+    # Given: JSON_REDUCER_PRETTY=1 and an optional --no-pretty on the command line
+    repo_root = Path(__file__).resolve().parents[2]
+    monkeypatch.setenv("JSON_REDUCER_PRETTY", "1")
+    mod = _load_json_reducer_module(repo_root)
+    calls = []
+    monkeypatch.setattr(mod, "setup_logging", lambda _log_dir: None)
+    monkeypatch.setattr(mod, "process_directory", lambda *_args, **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(sys, "argv", ["json_reducer.py", "--work_dir", str(tmp_path), *flag])
+
+    # When: running the CLI
+    mod.main()
+
+    # Then: the command line wins over the environment default
+    assert calls[0]["pretty"] is expected
+
+
+def test_process_directory_skips_unchanged_videos_on_rerun(tmp_path: Path, monkeypatch):
+    # Given: a project reduced once
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    docs_dir = tmp_path / "Camille Cache" / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "clip.mp4").write_bytes(b"")
+    _write_json(docs_dir / "clip.json", {"fps": 25, "total_frames": 3, "frames": []})
+    _write_json(docs_dir / "clip_audio.json", {"fps": 25, "total_frames": 3, "frames_analysis": []})
+    mod.process_directory(str(tmp_path), keyword="Camille")
+    assert (docs_dir / mod.REDUCTION_CACHE_NAME).exists()
+
+    reduced_paths = []
+    original = mod._load_and_reduce_video_json
+
+    def tracking_spy(path):
+        reduced_paths.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(mod, "_load_and_reduce_video_json", tracking_spy)
+
+    # When: running again without changes, then after the audio JSON changed, then with force
+    mod.process_directory(str(tmp_path), keyword="Camille")
+    unchanged_calls = list(reduced_paths)
+    _write_json(docs_dir / "clip_audio.json", {"fps": 25, "total_frames": 4, "frames_analysis": []})
+    mod.process_directory(str(tmp_path), keyword="Camille")
+    changed_calls = list(reduced_paths)
+    mod.process_directory(str(tmp_path), keyword="Camille", force=True)
+
+    # Then: only the changed and forced runs reduce the tracking again
+    assert unchanged_calls == []
+    assert changed_calls == ["clip_tracking.json"]
+    assert reduced_paths == ["clip_tracking.json", "clip_tracking.json"]
+    tracking = json.loads((docs_dir / "clip_tracking.json").read_text(encoding="utf-8"))
+    assert tracking["temporal_alignment"]["audio_total_frames"] == 4
+
+
+def test_process_directory_validates_cached_videos_when_validation_is_enabled(tmp_path: Path, monkeypatch):
+    # Given: a project reduced and cached without validation
+    pytest.importorskip("fastjsonschema")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    docs_dir = tmp_path / "Camille Validate" / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "clip.mp4").write_bytes(b"")
+    _write_json(docs_dir / "clip.json", {"fps": 25, "frames": []})
+    mod.process_directory(str(tmp_path), keyword="Camille")
+    schema_path = tmp_path / "schema.json"
+    _write_json(schema_path, {"type": "object", "required": ["frames_analysis", "project_id"]})
+    reduced_before = (docs_dir / "clip_tracking.json").read_bytes()
+
+    validated = []
+    original = mod._compiled_schema_validator
+
+    def validator_spy(path):
+        validated.append(path)
+        return original(path)
+
+    monkeypatch.setattr(mod, "_compiled_schema_validator", validator_spy)
+
+    # When: running again with --validate and an unchanged tree
+    mod.process_directory(str(tmp_path), keyword="Camille", schema_path=str(schema_path))
+
+    # Then: the cached video is validated instead of being skipped
+    assert validated == [str(schema_path)]
+    assert (docs_dir / "clip_tracking.json").read_bytes() == reduced_before
+
+
+def test_process_directory_does_not_rewrite_already_reduced_files(tmp_path: Path):
+    # Given: a project whose tracking and audio JSONs were already reduced
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    docs_dir = tmp_path / "Camille Reduced" / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "clip.mp4").write_bytes(b"")
+    _write_json(docs_dir / "clip_tracking.json", {"fps": 25, "frames": [{"frame": 1, "tracked_objects": []}]})
+    _write_json(docs_dir / "clip_audio.json", {"fps": 25, "frames_analysis": []})
+    mod.process_directory(str(tmp_path), keyword="Camille")
+    mtimes = {p.name: p.stat().st_mtime_ns for p in docs_dir.glob("clip*.json")}
+
+    # When: forcing a new reduction of the same files
+    mod.process_directory(str(tmp_path), keyword="Camille", force=True)
+
+    # Then: identical outputs are not rewritten
+    assert {p.name: p.stat().st_mtime_ns for p in docs_dir.glob("clip*.json")} == mtimes
+
+
+def test_dumps_json_falls_back_to_stdlib_when_orjson_rejects_payload():
+    # Given: a payload orjson cannot serialize (integer wider than 64 bits)
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    if mod.orjson is None:
+        pytest.skip("orjson not installed")
+    payload = {"frames_analysis": [], "total_frames": 2**70}
+
+    # When: serializing it
+    data = mod._dumps_json(payload)
+
+    # Then: the stdlib encoder produced equivalent JSON
+    assert json.loads(data) == payload
+
+
+def test_load_json_parses_large_files_through_mmap(tmp_path: Path, monkeypatch):
+    # Given: orjson available and files above the mmap threshold, one with a NaN token
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    if mod.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(mod, "_MMAP_MIN_BYTES", 1)
+    valid = tmp_path / "clip.json"
+    _write_json(valid, {"fps": 25.0, "label": "visage é"})
+    with_nan = tmp_path / "clip_nan.json"
+    with_nan.write_text('{"confidence": NaN}', encoding="utf-8")
+
+    # When: loading both files
+    loaded = mod._load_json(valid)
+    loaded_nan = mod._load_json(with_nan)
+
+    # Then: orjson parses the mapping, and the stdlib parser handles what orjson rejects
+    assert loaded == {"fps": 25.0, "label": "visage é"}
+    assert loaded_nan["confidence"] != loaded_nan["confidence"]
+
+
+def test_process_directory_skips_tracking_write_when_schema_validation_fails(tmp_path: Path):
+    # Given: a schema requiring a field the reduced tracking does not contain
+    pytest.importorskip("fastjsonschema")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    schema_path = tmp_path / "schema.json"
+    _write_json(schema_path, {"type": "object", "required": ["frames_analysis", "project_id"]})
+    docs_dir = tmp_path / "Camille Schema" / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "clip.mp4").write_bytes(b"")
+    _write_json(docs_dir / "clip.json", {"fps": 25, "frames": []})
+
+    # When: reducing with validation enabled
+    mod.process_directory(str(tmp_path), keyword="Camille", schema_path=str(schema_path))
+
+    # Then: the invalid output is not written and the video is not marked as reduced
+    assert not (docs_dir / "clip_tracking.json").exists()
+    assert not (docs_dir / mod.REDUCTION_CACHE_NAME).exists()
+
+
+def test_process_directory_schema_validation_does_not_inject_defaults(tmp_path: Path):
+    # Given: a schema declaring a default for a field absent from the reduced tracking
+    pytest.importorskip("fastjsonschema")
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    schema_path = tmp_path / "schema.json"
+    _write_json(schema_path, {
+        "type": "object",
+        "properties": {"project_id": {"type": "string", "default": "injecte"}},
+    })
+    docs_dir = tmp_path / "Camille Defaults" / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "clip.mp4").write_bytes(b"")
+    _write_json(docs_dir / "clip.json", {"fps": 25, "frames": []})
+
+    # When: reducing with validation enabled
+    mod.process_directory(str(tmp_path), keyword="Camille", schema_path=str(schema_path))
+
+    # Then: the written output is unchanged by the validator
+    written = json.loads((docs_dir / "clip_tracking.json").read_text(encoding="utf-8"))
+    assert "project_id" not in written
+
+
+def test_load_json_falls_back_to_read_when_mmap_is_unsupported(tmp_path: Path, monkeypatch):
+    # Given: a file above the mmap threshold on a filesystem where mmap fails
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    if mod.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(mod, "_MMAP_MIN_BYTES", 1)
+
+    def unsupported_mmap(*args, **kwargs):
+        raise OSError(19, "No such device")
+
+    monkeypatch.setattr(mod.mmap, "mmap", unsupported_mmap)
+    path = tmp_path / "clip.json"
+    _write_json(path, {"frames": []})
+
+    # When: loading the file
+    loaded = mod._load_json(path)
+
+    # Then: the regular buffered read is used
+    assert loaded == {"frames": []}
+
+
+def test_reduce_video_json_reuses_already_reduced_and_enriched_frames():
+    # Given: an already reduced, fully enriched tracking JSON and a partially reduced one
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    obj = {
+        "id": "face_1",
+        "centroid_x": 10.0,
+        "source": "face_landmarker",
+        "label": "face",
+        "confidence": 0.9,
+        "active_speakers": [],
+        "bbox_width": 4,
+        "bbox_height": 5,
+    }
+    reduced = {
+        "fps": 25.0,
+        "frames_analysis": [{"frame": 3, "tracked_objects": [obj]}],
+        "temporal_alignment": {"warnings": []},
+    }
+    partial = {"frames_analysis": [{"frame": 3, "tracked_objects": [dict(obj, landmarks=[[0, 0]])]}]}
+
+    # When: reducing both again
+    again = mod.reduce_video_json(reduced)
+    partial_again = mod.reduce_video_json(partial)
+
+    # Then: enriched frames are reused as-is, other inputs still go through the full reduction
+    assert again["frames_analysis"] is reduced["frames_analysis"]
+    assert again == {"frames_analysis": reduced["frames_analysis"], "fps": 25.0, "total_frames": 3}
+    assert partial_again["frames_analysis"] == [{"frame": 3, "tracked_objects": [obj]}]
+
+
+@pytest.mark.parametrize(
+    "bad_frame",
+    [
+        {"frame": 80, "tracked_objects": None},
+        {"frame": 80, "tracked_objects": [{"id": "late", "active_speakers": [], "extra": 1}]},
+    ],
+)
+def test_reduce_video_json_fully_reduces_when_a_frame_outside_the_sample_is_not_reduced(bad_frame):
+    # Given: enriched reduced frames, plus a non-reduced frame past the enrichment sample
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    obj = {
+        "id": "face_1",
+        "centroid_x": 10.0,
+        "source": "face_landmarker",
+        "label": "face",
+        "confidence": 0.9,
+        "active_speakers": [],
+        "bbox_width": 4,
+        "bbox_height": 5,
+    }
+    frames = [{"frame": i, "tracked_objects": [dict(obj)]} for i in range(1, mod._ENRICHMENT_SAMPLE_MAX_FRAMES + 10)]
+    frames.append(bad_frame)
+
+    # When: reducing it again
+    again = mod.reduce_video_json({"frames_analysis": frames})
+
+    # Then: the output matches a full reduction of every frame
+    assert again["frames_analysis"] == [mod._reduce_tracking_frame(frame) for frame in frames]
+
+
+def test_reduce_video_json_fully_reduces_objects_with_a_half_bbox():
+    # Given: an enriched reduced object past the per-frame sample with bbox_height None
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    obj = {
+        "id": "face_1",
+        "centroid_x": 10.0,
+        "source": "face_landmarker",
+        "label": "face",
+        "confidence": 0.9,
+        "active_speakers": [],
+        "bbox_width": 4,
+        "bbox_height": 5,
+    }
+    tracked = [dict(obj) for _ in range(mod._ENRICHMENT_SAMPLE_MAX_OBJECTS_PER_FRAME)]
+    tracked.append(dict(obj, bbox_height=None))
+
+    # When: reducing it again
+    again = mod.reduce_video_json({"frames_analysis": [{"frame": 1, "tracked_objects": tracked}]})
+
+    # Then: the half bbox is dropped, as a full reduction does
+    last = again["frames_analysis"][0]["tracked_objects"][-1]
+    assert "bbox_width" not in last and "bbox_height" not in last
+
+
+def test_safe_int_converts_bools_to_plain_ints():
+    # Given: the reducer module
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+
+    # When: converting bools, ints and numeric strings
+    values = [mod._safe_int(True), mod._safe_int(False), mod._safe_int(7), mod._safe_int("12"), mod._safe_int(None)]
+
+    # Then: bools come back as plain ints, as int(value) would return
+    assert values == [1, 0, 7, 12, None]
+    assert type(values[0]) is int
+    assert mod._extract_top_level_metadata({"total_frames": True}) == (None, 1)
+
+
+@pytest.mark.parametrize("raw", ["", "beaucoup"])
+def test_default_workers_ignores_invalid_step6_workers_env(monkeypatch, raw):
+    # Given: an empty or non-numeric STEP6_WORKERS
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setenv("STEP6_WORKERS", raw)
+
+    # When: computing the --workers default
+    workers = mod._default_workers()
+
+    # Then: the sequential default is used instead of crashing argparse setup
+    assert workers == 1
+
+
+def test_default_workers_is_sequential_without_step6_workers_env(monkeypatch):
+    # Given: no STEP6_WORKERS in the environment
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.delenv("STEP6_WORKERS", raising=False)
+
+    # When / Then: projects are reduced one at a time, keeping the progress lines ordered
+    assert mod._default_workers() == 1
+
+
+def test_default_workers_honours_valid_step6_workers_env(monkeypatch):
+    # Given: a numeric STEP6_WORKERS
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    monkeypatch.setenv("STEP6_WORKERS", "3")
+
+    # When / Then: it is used as the default
+    assert mod._default_workers() == 3
+
+
+def test_project_json_bytes_ignores_reduction_cache_manifest(tmp_path):
+    # Given: a project docs/ with one tracking JSON and a large cache manifest
+    repo_root = Path(__file__).resolve().parents[2]
+    mod = _load_json_reducer_module(repo_root)
+    docs = tmp_path / "projet" / "docs"
+    docs.mkdir(parents=True)
+    (docs / "clip_tracking.json").write_bytes(b"x" * 10)
+    (docs / mod.REDUCTION_CACHE_NAME).write_bytes(b"y" * 1000)
+
+    # When / Then: only the reducible JSONs count towards the project cost
+    assert mod._project_json_bytes(tmp_path, "projet") == 10
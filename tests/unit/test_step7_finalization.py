@@ -5,6 +5,7 @@ import errno
 import importlib.util
 import logging
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
@@ -77,3 +78,745 @@ class TestStep7FinalizationChmodFallback:
         # Then:  Expected result/verification
         assert 'Destination ne supporte pas chmod' in caplog.text
         assert 'cp --no-preserve a échoué' in caplog.text
+
+
+class TestStep7FinalizationParallelMain:
+    @pytest.mark.parametrize('raw, expected', [('', 4), ('beaucoup', 4), ('0', 1), ('6', 6)])
+    def test_finalize_workers_env_is_parsed_defensively(self, monkeypatch, raw, expected):
+        # Given: Preconditions
+        monkeypatch.setenv('FINALIZE_WORKERS', raw)
+
+        # When:  Operation to execute
+        mod = _load_finalize_module()
+
+        # Then:  Expected result/verification
+        assert mod.FINALIZE_WORKERS == expected
+
+    def test_main_finalizes_all_projects_through_worker_pool(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        projects = [tmp_path / f'projet_{i}' for i in range(5)]
+        finalized = []
+
+        def _fake_finalize(project_dir):
+            finalized.append(project_dir)
+            return project_dir.name != 'projet_3'
+
+        monkeypatch.setattr(mod, 'FINALIZE_WORKERS', 3)
+        monkeypatch.setattr(mod, '_select_output_dir', lambda preferred, _base: tmp_path / 'out')
+        monkeypatch.setattr(mod, 'find_projects_to_finalize', lambda: list(projects))
+        monkeypatch.setattr(mod, 'finalize_project', _fake_finalize)
+
+        # When:  Operation to execute
+        with pytest.raises(SystemExit) as exc_info:
+            mod.main()
+
+        # Then:  Expected result/verification
+        assert exc_info.value.code == 1
+        assert sorted(finalized) == sorted(projects)
+
+
+class TestStep7FinalizationNativeCopy:
+    def test_copy_project_tree_uses_cp_reflink_when_rsync_missing(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        src = tmp_path / 'src_project'
+        dst = tmp_path / 'dst_project'
+        (src / 'docs').mkdir(parents=True)
+        (src / 'docs' / 'clip.mp4').write_bytes(b'video')
+
+        calls = []
+        real_run = subprocess.run
+
+        def _recording_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(mod, '_destination_supports_chmod', lambda _dst: True)
+        monkeypatch.setattr(mod, '_TOOL_PATHS', {'rsync': None, 'cp': '/bin/cp'})
+        monkeypatch.setattr(mod.subprocess, 'run', _recording_run)
+
+        # When:  Operation to execute
+        mod._copy_project_tree(src, dst)
+
+        # Then:  Expected result/verification
+        assert [cmd[:3] for cmd in calls] == [['cp', '-aL', '--reflink=auto']]
+        assert (dst / 'docs' / 'clip.mp4').read_bytes() == b'video'
+
+    def test_copy_project_tree_copies_symlink_targets_like_copytree(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: a project whose docs/ video is an absolute symlink into the source tree
+        src = tmp_path / 'src_project'
+        dst = tmp_path / 'dst_project'
+        (src / 'docs').mkdir(parents=True)
+        (src / 'raw.mp4').write_bytes(b'video')
+        (src / 'docs' / 'v.mp4').symlink_to(src / 'raw.mp4')
+        rsync_calls = []
+
+        def _fake_rsync(cmd, *_args, **_kwargs):
+            rsync_calls.append(cmd)
+            raise subprocess.CalledProcessError(1, cmd)
+
+        monkeypatch.setattr(mod, '_destination_supports_chmod', lambda _dst: True)
+        monkeypatch.setattr(mod, '_TOOL_PATHS', {'rsync': '/usr/bin/rsync', 'cp': '/bin/cp'})
+        real_run = subprocess.run
+        monkeypatch.setattr(
+            mod.subprocess, 'run',
+            lambda cmd, *a, **kw: _fake_rsync(cmd) if cmd[0] == 'rsync' else real_run(cmd, *a, **kw),
+        )
+
+        # When:  Operation to execute
+        mod._copy_project_tree(src, dst)
+
+        # Then:  Expected result/verification
+        assert rsync_calls[0][:2] == ['rsync', '-aL']
+        copied = dst / 'docs' / 'v.mp4'
+        assert not copied.is_symlink()
+        assert copied.read_bytes() == b'video'
+
+    def test_copy_project_tree_falls_back_to_copytree_without_native_tools(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        src = tmp_path / 'src_project'
+        dst = tmp_path / 'dst_project'
+        src.mkdir(parents=True)
+        (src / 'hello.txt').write_text('hello', encoding='utf-8')
+
+        def _unexpected_run(cmd, *_args, **_kwargs):
+            raise AssertionError(f'Unexpected subprocess.run call: {cmd}')
+
+        monkeypatch.setattr(mod, '_destination_supports_chmod', lambda _dst: True)
+        monkeypatch.setattr(mod, '_TOOL_PATHS', {'rsync': None, 'cp': None})
+        monkeypatch.setattr(mod.subprocess, 'run', _unexpected_run)
+
+        # When:  Operation to execute
+        mod._copy_project_tree(src, dst)
+
+        # Then:  Expected result/verification
+        assert (dst / 'hello.txt').read_text(encoding='utf-8') == 'hello'
+
+
+class TestStep7FinalizationProjectDiscovery:
+    def _make_projects(self, work_dir):
+        ready = work_dir / 'projet_pret' / 'docs' / 'sous'
+        ready.mkdir(parents=True)
+        (ready / 'clip.mp4').write_bytes(b'video')
+        (work_dir / 'projet_pret' / 'clip_scenes.csv').write_text('', encoding='utf-8')
+        (work_dir / 'projet_pret' / 'docs' / 'clip_tracking.json').write_text('{}', encoding='utf-8')
+
+        audio_only = work_dir / 'projet_audio' / 'docs'
+        audio_only.mkdir(parents=True)
+        (audio_only / 'clip.mp4').write_bytes(b'video')
+        (audio_only / 'clip_audio.json').write_text('{}', encoding='utf-8')
+
+        bare = work_dir / 'projet_nu'
+        bare.mkdir()
+        (bare / 'clip.mp4').write_bytes(b'video')
+        (bare / 'autre_tracking.json').write_text('{}', encoding='utf-8')
+
+        (work_dir / '_temp_projet').mkdir()
+        (work_dir / '_temp_projet' / 'clip.mp4').write_bytes(b'video')
+
+    @pytest.mark.parametrize('mode, expected', [
+        ('strict', {'projet_pret'}),
+        ('lenient', {'projet_pret', 'projet_audio'}),
+        ('videos', {'projet_pret', 'projet_audio', 'projet_nu'}),
+    ])
+    def test_find_projects_to_finalize_matches_artifacts_by_stem(self, tmp_path, monkeypatch, mode, expected):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        self._make_projects(tmp_path)
+        monkeypatch.setattr(mod, 'WORK_DIR', tmp_path)
+        monkeypatch.setattr(mod, 'FINALIZE_MODE', mode)
+
+        # When:  Operation to execute
+        projects = mod.find_projects_to_finalize()
+
+        # Then:  Expected result/verification
+        assert {p.name for p in projects} == expected
+
+
+class TestStep7FinalizationChmodProbeCache:
+    def test_destination_supports_chmod_probes_each_device_once(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        chmod_calls = []
+        real_chmod = mod.os.chmod
+
+        def _counting_chmod(*args, **kwargs):
+            chmod_calls.append(args)
+            return real_chmod(*args, **kwargs)
+
+        monkeypatch.setattr(mod.os, 'chmod', _counting_chmod)
+
+        # When:  Operation to execute
+        first = mod._destination_supports_chmod(tmp_path / 'projet_a')
+        second = mod._destination_supports_chmod(tmp_path / 'projet_b')
+
+        # Then:  Expected result/verification
+        assert first is True and second is True
+        assert len(chmod_calls) == 1
+        assert (tmp_path / 'projet_b').is_dir()
+
+
+class TestStep7FinalizationSameFilesystemMove:
+    def test_finalize_project_renames_source_when_on_same_filesystem(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'work' / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'clip.mp4').write_bytes(b'video')
+        output_dir = tmp_path / 'out'
+        output_dir.mkdir()
+
+        def _unexpected_copy(*_args, **_kwargs):
+            raise AssertionError('copy must not run for a same-filesystem move')
+
+        monkeypatch.setattr(mod, 'OUTPUT_DIR', output_dir)
+        monkeypatch.setattr(mod.ResultsArchiver, 'archive_project_analysis', staticmethod(lambda _name: {}))
+        monkeypatch.setattr(mod, '_copy_project_tree', _unexpected_copy)
+
+        # When:  Operation to execute
+        result = mod.finalize_project(project)
+
+        # Then:  Expected result/verification
+        assert result is True
+        assert not project.exists()
+        assert (output_dir / 'projet' / 'docs' / 'clip.mp4').read_bytes() == b'video'
+
+    def test_finalize_project_copies_when_rename_crosses_devices(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'work' / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'clip.mp4').write_bytes(b'video')
+        output_dir = tmp_path / 'out'
+        output_dir.mkdir()
+
+        def _raise_exdev(*_args, **_kwargs):
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+        monkeypatch.setattr(mod, 'OUTPUT_DIR', output_dir)
+        monkeypatch.setattr(mod.ResultsArchiver, 'archive_project_analysis', staticmethod(lambda _name: {}))
+        monkeypatch.setattr(mod.os, 'rename', _raise_exdev)
+
+        # When:  Operation to execute
+        result = mod.finalize_project(project)
+
+        # Then:  Expected result/verification
+        assert result is True
+        assert not project.exists()
+        assert (output_dir / 'projet' / 'docs' / 'clip.mp4').read_bytes() == b'video'
+
+
+    def test_finalize_project_does_not_ship_step6_cache_manifest(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: a project whose docs/ holds the step6 reduction cache manifest
+        project = tmp_path / 'work' / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'clip.mp4').write_bytes(b'video')
+        (project / 'docs' / mod.STEP6_CACHE_NAME).write_text('{}', encoding='utf-8')
+        output_dir = tmp_path / 'out'
+        output_dir.mkdir()
+
+        monkeypatch.setattr(mod, 'OUTPUT_DIR', output_dir)
+        monkeypatch.setattr(mod.ResultsArchiver, 'archive_project_analysis', staticmethod(lambda _name: {}))
+
+        # When:  Operation to execute
+        result = mod.finalize_project(project)
+
+        # Then:  Expected result/verification
+        assert result is True
+        assert (output_dir / 'projet' / 'docs' / 'clip.mp4').exists()
+        assert not (output_dir / 'projet' / 'docs' / mod.STEP6_CACHE_NAME).exists()
+
+
+class TestStep7FinalizationFastCopy:
+    def test_fast_copy_copies_content(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        src = tmp_path / 'clip.mp4'
+        dst = tmp_path / 'copie.mp4'
+        payload = bytes(range(256)) * 9000
+        src.write_bytes(payload)
+        dst.write_bytes(b'ancien contenu plus long que rien')
+
+        # When:  Operation to execute
+        mod._fast_copy(src, dst)
+
+        # Then:  Expected result/verification
+        assert dst.read_bytes() == payload
+
+    def test_fast_copy_falls_back_to_read_write_when_kernel_copies_unsupported(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        src = tmp_path / 'clip_tracking.json'
+        dst = tmp_path / 'copie.json'
+        payload = b'{"frames": []}' * 100000
+        src.write_bytes(payload)
+
+        def _raise_exdev(*_args, **_kwargs):
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+        def _raise_einval(*_args, **_kwargs):
+            raise OSError(errno.EINVAL, 'Invalid argument')
+
+        monkeypatch.setattr(mod.os, 'copy_file_range', _raise_exdev, raising=False)
+        monkeypatch.setattr(mod.os, 'sendfile', _raise_einval, raising=False)
+
+        # When:  Operation to execute
+        mod._fast_copy(src, dst)
+
+        # Then:  Expected result/verification
+        assert dst.read_bytes() == payload
+
+
+class TestStep7FinalizationPageCache:
+    def test_drop_page_cache_only_advises_large_files(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+        if not hasattr(mod.os, 'posix_fadvise'):
+            pytest.skip('posix_fadvise indisponible sur cette plateforme')
+
+        # Given: Preconditions
+        (tmp_path / 'docs').mkdir()
+        (tmp_path / 'docs' / 'clip.mp4').write_bytes(b'\0' * (2 * 1024 * 1024))
+        (tmp_path / 'docs' / 'clip_audio.json').write_text('{}', encoding='utf-8')
+
+        advised = []
+        real_fadvise = mod.os.posix_fadvise
+
+        def _recording_fadvise(fd, offset, length, advice):
+            advised.append((mod.os.fstat(fd).st_size, advice))
+            return real_fadvise(fd, offset, length, advice)
+
+        monkeypatch.setattr(mod.os, 'posix_fadvise', _recording_fadvise)
+
+        # When:  Operation to execute
+        mod._drop_page_cache(tmp_path)
+
+        # Then:  Expected result/verification
+        assert advised == [(2 * 1024 * 1024, mod.os.POSIX_FADV_DONTNEED)]
+
+    def test_finalize_project_waits_for_background_archive_before_moving_source(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'work' / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'clip.mp4').write_bytes(b'video')
+        output_dir = tmp_path / 'out'
+        output_dir.mkdir()
+        source_seen = []
+
+        def _slow_archive(_name):
+            time.sleep(0.05)
+            source_seen.append(project.exists())
+            return {}
+
+        monkeypatch.setattr(mod, 'OUTPUT_DIR', output_dir)
+        monkeypatch.setattr(mod.ResultsArchiver, 'archive_project_analysis', staticmethod(_slow_archive))
+
+        # When:  Operation to execute
+        result = mod.finalize_project(project)
+
+        # Then:  Expected result/verification
+        assert result is True
+        assert source_seen == [True]
+        assert not project.exists()
+
+
+class TestStep7FinalizationDocsNormalization:
+    def test_normalize_moves_media_and_analysis_into_docs(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'clip.mp4').write_bytes(b'video')
+        (project / 'clip.json').write_text('{}', encoding='utf-8')
+        (project / 'clip_tracking.json').write_text('{"new": 1}', encoding='utf-8')
+        (project / 'docs' / 'clip_tracking.json').write_text('{"old": 1}', encoding='utf-8')
+        (project / 'notes.txt').write_text('garder', encoding='utf-8')
+        (project / 'autre.json').write_text('{}', encoding='utf-8')
+
+        # When:  Operation to execute
+        mod._normalize_project_docs_structure(project)
+
+        # Then:  Expected result/verification
+        assert sorted(p.name for p in project.iterdir()) == ['autre.json', 'docs', 'notes.txt']
+        assert sorted(p.name for p in (project / 'docs').iterdir()) == [
+            'clip.json', 'clip.mp4', 'clip_tracking.json',
+        ]
+        assert (project / 'docs' / 'clip_tracking.json').read_text(encoding='utf-8') == '{"new": 1}'
+
+    def test_normalize_moves_root_json_of_video_already_in_docs(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'clip.mp4').write_bytes(b'video')
+        (project / 'clip.json').write_text('{}', encoding='utf-8')
+        (project / 'config.json').write_text('{}', encoding='utf-8')
+
+        # When:  Operation to execute
+        mod._normalize_project_docs_structure(project)
+
+        # Then:  Expected result/verification
+        assert (project / 'docs' / 'clip.json').exists()
+        assert (project / 'config.json').exists()
+
+    def test_normalize_moves_root_json_of_video_nested_in_docs(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'projet'
+        (project / 'docs' / 'sous' / 'profond').mkdir(parents=True)
+        (project / 'docs' / 'sous' / 'profond' / 'clip.mp4').write_bytes(b'video')
+        (project / 'clip.json').write_text('{}', encoding='utf-8')
+        (project / 'config.json').write_text('{}', encoding='utf-8')
+
+        # When:  Operation to execute
+        mod._normalize_project_docs_structure(project)
+
+        # Then:  Expected result/verification
+        assert (project / 'docs' / 'clip.json').exists()
+        assert (project / 'config.json').exists()
+
+    def test_normalize_matches_extensions_like_pathlib(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        project = tmp_path / 'projet'
+        project.mkdir()
+        for name in ('Clip.MOV', 'Clip.json', 'mesures.csv', 'table.CSV', 'README', '.mp4', 'photo.JPG'):
+            (project / name).write_bytes(b'x')
+
+        # When:  Operation to execute
+        mod._normalize_project_docs_structure(project)
+
+        # Then:  Expected result/verification
+        assert sorted(p.name for p in (project / 'docs').iterdir()) == [
+            'Clip.MOV', 'Clip.json', 'mesures.csv', 'photo.JPG',
+        ]
+        assert mod._split_name('a.b.mp4') == ('a.b', '.mp4')
+        assert mod._split_name('archive.') == ('archive.', '')
+
+
+class TestStep7FinalizationArchiveRestore:
+    def test_restore_archived_analysis_copies_artifacts_next_to_videos(self, tmp_path, monkeypatch, caplog):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        archive = tmp_path / 'archives'
+        archive.mkdir()
+        (archive / 'a_scenes.csv').write_text('scenes', encoding='utf-8')
+        (archive / 'b_tracking.json').write_text('{}', encoding='utf-8')
+        old_mtime_ns = 1_600_000_000_000_000_000
+        mod.os.utime(archive / 'a_scenes.csv', ns=(old_mtime_ns, old_mtime_ns))
+
+        project = tmp_path / 'out' / 'projet'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'a.mp4').write_bytes(b'a')
+        (project / 'b.mp4').write_bytes(b'b')
+
+        def _fake_find(_name, video, suffixes):
+            found = {}
+            for suffix in suffixes:
+                candidate = archive / f"{video.stem}{suffix}"
+                if candidate.exists():
+                    found[suffix] = candidate
+            if video.stem == 'b':
+                found[mod.AUDIO_SUFFIX] = archive / 'absent_audio.json'
+            return found
+
+        monkeypatch.setattr(mod.ResultsArchiver, 'find_analysis_files', staticmethod(_fake_find))
+        caplog.set_level(logging.WARNING)
+
+        # When:  Operation to execute
+        mod.restore_archived_analysis('projet', project)
+
+        # Then:  Expected result/verification
+        restored = project / 'docs' / 'a_scenes.csv'
+        assert restored.read_text(encoding='utf-8') == 'scenes'
+        assert restored.stat().st_mtime_ns == old_mtime_ns
+        assert (project / 'docs' / 'b_tracking.json').exists()
+        assert 'Restauration audio échouée' in caplog.text
+
+    def test_restore_archived_analysis_copies_each_destination_once(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        archive = tmp_path / 'archives'
+        (archive / 'a').mkdir(parents=True)
+        (archive / 'b').mkdir(parents=True)
+        (archive / 'a' / 'clip_audio.json').write_text('{"source": "a"}', encoding='utf-8')
+        (archive / 'b' / 'clip_audio.json').write_text('{"source": "b"}', encoding='utf-8')
+
+        project = tmp_path / 'out' / 'projet'
+        (project / 'docs' / 'a').mkdir(parents=True)
+        (project / 'docs' / 'b').mkdir(parents=True)
+        (project / 'docs' / 'a' / 'clip.mp4').write_bytes(b'a')
+        (project / 'docs' / 'b' / 'clip.mp4').write_bytes(b'b')
+
+        def _fake_find(_name, video, _suffixes):
+            return {mod.AUDIO_SUFFIX: archive / video.parent.name / 'clip_audio.json'}
+
+        copied = []
+        real_copy = mod._copy_file_with_times
+
+        def _recording_copy(src, dst):
+            copied.append(dst)
+            real_copy(src, dst)
+
+        monkeypatch.setattr(mod.ResultsArchiver, 'find_analysis_files', staticmethod(_fake_find))
+        monkeypatch.setattr(mod, '_copy_file_with_times', _recording_copy)
+
+        # When:  Operation to execute
+        mod.restore_archived_analysis('projet', project)
+
+        # Then:  Expected result/verification
+        assert copied == [project / 'docs' / 'clip_audio.json']
+        assert (project / 'docs' / 'clip_audio.json').read_text(encoding='utf-8') in ('{"source": "a"}', '{"source": "b"}')
+
+    def test_destination_supports_chmod_skips_probe_on_known_ntfs_mount(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        mount_point = tmp_path / 'disque externe'
+        mount_point.mkdir()
+        escaped = str(mount_point.resolve()).replace(' ', '\\040')
+        mountinfo = tmp_path / 'mountinfo'
+        mountinfo.write_text(
+            "22 1 259:2 / / rw,relatime shared:1 - ext4 /dev/root rw\n"
+            f"98 22 8:17 / {escaped} rw,relatime shared:50 - fuseblk /dev/sdb1 rw,user_id=0\n",
+            encoding='utf-8',
+        )
+
+        def _unexpected_chmod(*_args, **_kwargs):
+            raise AssertionError('chmod probe must be skipped on a known NTFS mount')
+
+        monkeypatch.setattr(mod, '_MOUNTINFO_PATH', str(mountinfo))
+        monkeypatch.setattr(mod.os, 'chmod', _unexpected_chmod)
+
+        # When:  Operation to execute
+        supports = mod._destination_supports_chmod(mount_point / 'projet')
+
+        # Then:  Expected result/verification
+        assert supports is False
+
+
+class TestStep7FinalizationWritableProbe:
+    def test_is_dir_writable_leaves_no_file_behind(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        target = tmp_path / 'sortie'
+
+        # When:  Operation to execute
+        writable = mod._is_dir_writable(target)
+
+        # Then:  Expected result/verification
+        assert writable is True
+        assert list(target.iterdir()) == []
+
+    def test_is_dir_writable_falls_back_when_o_tmpfile_unsupported(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        real_open = mod.os.open
+        tmpfile_flag = 1 << 30
+
+        def _open_without_tmpfile(path, flags, *args, **kwargs):
+            if flags & tmpfile_flag:
+                raise OSError(errno.EOPNOTSUPP, 'Operation not supported')
+            return real_open(path, flags, *args, **kwargs)
+
+        monkeypatch.setattr(mod, '_O_TMPFILE', tmpfile_flag)
+        monkeypatch.setattr(mod.os, 'open', _open_without_tmpfile)
+
+        # When:  Operation to execute
+        writable = mod._is_dir_writable(tmp_path)
+
+        # Then:  Expected result/verification
+        assert writable is True
+
+    def test_is_dir_writable_still_creates_a_named_file_after_o_tmpfile_succeeds(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: a directory where anonymous inodes work but named files are refused
+        def _refuse_named(*_args, **_kwargs):
+            raise PermissionError(errno.EACCES, 'Permission denied')
+
+        monkeypatch.setattr(mod.tempfile, 'NamedTemporaryFile', _refuse_named)
+
+        # When:  Operation to execute
+        writable = mod._is_dir_writable(tmp_path)
+
+        # Then:  Expected result/verification
+        assert writable is False
+
+    def test_is_dir_writable_stops_on_read_only_o_tmpfile_refusal(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        tmpfile_flag = 1 << 30
+
+        def _read_only_open(path, flags, *args, **kwargs):
+            raise OSError(errno.EROFS, 'Read-only file system')
+
+        def _unexpected_named(*_args, **_kwargs):
+            raise AssertionError('named probe must not run after a read-only refusal')
+
+        monkeypatch.setattr(mod, '_O_TMPFILE', tmpfile_flag)
+        monkeypatch.setattr(mod.os, 'open', _read_only_open)
+        monkeypatch.setattr(mod.tempfile, 'NamedTemporaryFile', _unexpected_named)
+
+        # When:  Operation to execute
+        writable = mod._is_dir_writable(tmp_path)
+
+        # Then:  Expected result/verification
+        assert writable is False
+
+    def test_index_project_artifacts_stops_at_first_video_in_videos_mode(self, tmp_path):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        (tmp_path / 'clip.mp4').write_bytes(b'video')
+        (tmp_path / 'clip_tracking.json').write_text('{}', encoding='utf-8')
+        (tmp_path / 'docs').mkdir()
+        (tmp_path / 'docs' / 'autre.mp4').write_bytes(b'video')
+
+        # When:  Operation to execute
+        artifacts = mod._index_project_artifacts(tmp_path, first_video_only=True)
+
+        # Then:  Expected result/verification
+        assert list(artifacts['.mp4']) == ['clip']
+        assert artifacts[mod.TRACKING_SUFFIX] == {}
+
+    def test_python_fallback_copies_nested_tree(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        src = tmp_path / 'src_project'
+        dst = tmp_path / 'dst_project'
+        (src / 'docs' / 'sous').mkdir(parents=True)
+        (src / 'vide').mkdir()
+        (src / 'racine.txt').write_text('racine', encoding='utf-8')
+        (src / 'docs' / 'clip.mp4').write_bytes(b'video' * 1000)
+        (src / 'docs' / 'sous' / 'clip_tracking.json').write_text('{}', encoding='utf-8')
+
+        def _failing_run(cmd, *_args, **_kwargs):
+            raise subprocess.CalledProcessError(returncode=1, cmd=cmd)
+
+        monkeypatch.setattr(mod, '_destination_supports_chmod', lambda _dst: False)
+        monkeypatch.setattr(mod, '_TOOL_PATHS', {'rsync': None})
+        monkeypatch.setattr(mod.subprocess, 'run', _failing_run)
+
+        # When:  Operation to execute
+        mod._copy_project_tree(src, dst)
+
+        # Then:  Expected result/verification
+        assert (dst / 'racine.txt').read_text(encoding='utf-8') == 'racine'
+        assert (dst / 'docs' / 'clip.mp4').read_bytes() == b'video' * 1000
+        assert (dst / 'docs' / 'sous' / 'clip_tracking.json').read_text(encoding='utf-8') == '{}'
+        assert (dst / 'vide').is_dir()
+
+
+class TestStep7FinalizationRmtree:
+    def _make_tree(self, root, count):
+        (root / 'docs').mkdir(parents=True)
+        for i in range(count):
+            (root / 'docs' / f'frame_{i}.png').write_bytes(b'x')
+
+    def test_safe_rmtree_uses_rm_for_large_trees(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        tree = tmp_path / 'projet'
+        self._make_tree(tree, 40)
+        calls = []
+        real_run = subprocess.run
+
+        def _recording_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(mod.subprocess, 'run', _recording_run)
+
+        # When:  Operation to execute
+        mod._safe_rmtree(tree)
+
+        # Then:  Expected result/verification
+        assert calls == [['rm', '-rf', '--', str(tree)]]
+        assert not tree.exists()
+
+    def test_safe_rmtree_falls_back_to_shutil_when_rm_fails(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        tree = tmp_path / 'projet'
+        self._make_tree(tree, 40)
+
+        def _failing_run(cmd, *_args, **_kwargs):
+            raise subprocess.CalledProcessError(returncode=1, cmd=cmd)
+
+        monkeypatch.setattr(mod, '_TOOL_PATHS', {'rm': '/bin/rm'})
+        monkeypatch.setattr(mod.subprocess, 'run', _failing_run)
+
+        # When:  Operation to execute
+        mod._safe_rmtree(tree)
+
+        # Then:  Expected result/verification
+        assert not tree.exists()
+
+    def test_safe_rmtree_keeps_python_path_for_small_trees(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+
+        # Given: Preconditions
+        tree = tmp_path / 'projet'
+        self._make_tree(tree, 3)
+
+        def _unexpected_run(cmd, *_args, **_kwargs):
+            raise AssertionError(f'Unexpected subprocess.run call: {cmd}')
+
+        monkeypatch.setattr(mod.subprocess, 'run', _unexpected_run)
+
+        # When:  Operation to execute
+        mod._safe_rmtree(tree)
+
+        # Then:  Expected result/verification
+        assert not tree.exists()
+
+
+class TestStep7FinalizationFastCopyAdvice:
+    def test_fast_copy_advises_sequential_then_dontneed_on_source(self, tmp_path, monkeypatch):
+        mod = _load_finalize_module()
+        if not hasattr(mod.os, 'posix_fadvise'):
+            pytest.skip('posix_fadvise indisponible sur cette plateforme')
+
+        # Given: Preconditions
+        src = tmp_path / 'clip.mp4'
+        dst = tmp_path / 'copie.mp4'
+        src.write_bytes(b'video' * 100)
+        advised = []
+
+        monkeypatch.setattr(mod.os, 'posix_fadvise', lambda _fd, _off, _len, advice: advised.append(advice))
+
+        # When:  Operation to execute
+        mod._fast_copy(src, dst)
+
+        # Then:  Expected result/verification
+        assert advised == [mod.os.POSIX_FADV_SEQUENTIAL, mod.os.POSIX_FADV_DONTNEED]
+        assert dst.read_bytes() == b'video' * 100
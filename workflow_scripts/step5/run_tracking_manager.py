@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import os, sys, json, argparse, subprocess, threading, time, logging
+import os, re, sys, json, argparse, functools, subprocess, threading, time, logging
 from pathlib import Path
-from collections import OrderedDict, deque
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Mapping, Optional
+from typing import Iterable, Mapping, Optional
 
 try:
     from dotenv import load_dotenv
 except ImportError:
     load_dotenv = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class _EnvConfig:
     def __init__(self, environ: Mapping[str, str]):
@@ -52,7 +59,7 @@ class _EnvConfig:
         raw = self.get_str(key, default="").strip().lower()
         return [p.strip() for p in raw.split(",") if p.strip()]
 
-    def snapshot(self, keys: list[str]) -> dict[str, Optional[str]]:
+    def snapshot(self, keys: Iterable[str]) -> dict[str, Optional[str]]:
         return {k: self.get_optional_str(k) for k in keys}
 
 
@@ -69,7 +76,7 @@ def _load_env_file():
         line = raw_line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
-        key, value = line.split("=", 1)
+        key, _, value = line.partition("=")
         key = key.strip()
         if not key:
             continue
@@ -83,23 +90,32 @@ _load_env_file()
 ENV = _EnvConfig(os.environ)
 step5_enable_object_detection = ENV.get_bool("STEP5_ENABLE_OBJECT_DETECTION", default=True)
 
+_RELEVANT_ENV_KEYS = (
+    "STEP5_ENABLE_GPU",
+    "STEP5_GPU_ENGINES",
+    "STEP5_TRACKING_ENGINE",
+    "TRACKING_DISABLE_GPU",
+    "TRACKING_CPU_WORKERS",
+    "STEP5_GPU_FALLBACK_AUTO",
+    "STEP5_ENABLE_OBJECT_DETECTION",
+    "INSIGHTFACE_HOME",
+)
+
+
 def _log_env_snapshot():
-    relevant_keys = [
-        "STEP5_ENABLE_GPU",
-        "STEP5_GPU_ENGINES",
-        "STEP5_TRACKING_ENGINE",
-        "TRACKING_DISABLE_GPU",
-        "TRACKING_CPU_WORKERS",
-        "STEP5_GPU_FALLBACK_AUTO",
-        "STEP5_ENABLE_OBJECT_DETECTION",
-        "INSIGHTFACE_HOME",
-    ]
-    snapshot = ENV.snapshot(relevant_keys)
-    logging.info(f"[EnvSnapshot] {snapshot}")
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    logging.info("[EnvSnapshot] %s", ENV.snapshot(_RELEVANT_ENV_KEYS))
 
 
 # --- CONFIGURATIONS GLOBALES ---
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+SCRIPT_DIR = Path(__file__).resolve().parent
+BASE_DIR = SCRIPT_DIR.parent.parent
+MODELS_DIR = SCRIPT_DIR / "models"
+WORKER_SCRIPTS = {
+    "single": SCRIPT_DIR / "process_video_worker.py",
+    "multi": SCRIPT_DIR / "process_video_worker_multiprocessing.py",
+}
 
 try:
     sys.path.insert(0, str(BASE_DIR))
@@ -116,7 +132,7 @@ TRACKING_ENV_PYTHON = Path(TRACKING_ENV_PYTHON)
 EOS_ENV_PYTHON = Path(EOS_ENV_PYTHON)
 INSIGHTFACE_ENV_PYTHON = Path(INSIGHTFACE_ENV_PYTHON)
 
-WORKER_SCRIPT = Path(__file__).parent / "process_video_worker.py"
+WORKER_SCRIPT = WORKER_SCRIPTS["single"]
 
 TRACKING_ENGINE = None
 
@@ -136,6 +152,41 @@ CUDA_LIB_SUBDIRS = [
     "nvjitlink/lib",
 ]
 
+@dataclass(frozen=True)
+class EngineCaps:
+    """Scheduling capabilities of a tracking engine."""
+    gpu_capable: bool = False
+    gpu_only: bool = False
+    cpu_only: bool = False
+
+
+# Keys are normalized engine names; "" is the default MediaPipe landmarker.
+ENGINE_CAPABILITIES: dict[str, EngineCaps] = {
+    "": EngineCaps(gpu_capable=True),
+    "openseeface": EngineCaps(gpu_capable=True),
+    "opencv_yunet_pyfeat": EngineCaps(gpu_capable=True),
+    "insightface": EngineCaps(gpu_capable=True, gpu_only=True),
+    "opencv_haar": EngineCaps(cpu_only=True),
+    "opencv_yunet": EngineCaps(cpu_only=True),
+    "eos": EngineCaps(cpu_only=True),
+}
+DEFAULT_ENGINE_CAPS = EngineCaps()
+
+# Aliases of the default MediaPipe landmarker; other names pass through unchanged.
+_ENGINE_NORMALIZE: dict[str, str] = {
+    "": "",
+    "mediapipe": "",
+    "mediapipe_landmarker": "",
+}
+
+
+def _normalize_engine(tracking_engine) -> str:
+    """Return the canonical engine key ("" for the default MediaPipe landmarker)."""
+    if tracking_engine is None:
+        return ""
+    raw = str(tracking_engine).strip().casefold()
+    return _ENGINE_NORMALIZE.get(raw, raw)
+
 SYSTEM_CUDA_DEFAULTS = [
     "/usr/local/cuda-12.4",
     "/usr/local/cuda-12",
@@ -150,22 +201,55 @@ def _build_venv_cuda_paths(python_exe: Path) -> list[str]:
         venv_dir = Path(python_exe).expanduser().parent.parent
     except Exception:
         return []
+    return list(_scan_venv_cuda_paths(venv_dir))
+
 
+@functools.lru_cache(maxsize=None)
+def _scan_venv_cuda_paths(venv_dir: Path) -> tuple[str, ...]:
+    """Scan a venv's nvidia wheels once; installed packages do not change during a run."""
     python_version = f"python{sys.version_info.major}.{sys.version_info.minor}"
     site_packages = venv_dir / "lib" / python_version / "site-packages"
     nvidia_dir = site_packages / "nvidia"
-    if not nvidia_dir.exists():
-        return []
+    try:
+        with os.scandir(nvidia_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return ()
+
+    return tuple(
+        str(nvidia_dir / sub)
+        for sub in CUDA_LIB_SUBDIRS
+        if sub.split("/", 1)[0] in present and (nvidia_dir / sub).is_dir()
+    )
+
+
+# Seconds before an empty system CUDA probe is retried (CUDA may be installed while the manager runs).
+SYSTEM_CUDA_RETRY_SECONDS = 300.0
+CUDA_PROBE_MAX_WORKERS = 16
 
-    paths = []
-    for sub in CUDA_LIB_SUBDIRS:
-        candidate = nvidia_dir / sub
-        if candidate.exists():
-            paths.append(str(candidate))
-    return paths
+_system_cuda_cache: Optional[tuple[_EnvConfig, float, list[str]]] = None
 
 
 def _discover_system_cuda_lib_paths(env: _EnvConfig) -> list[str]:
+    """
+    Return the host CUDA library paths, probing the filesystem only once per manager run.
+
+    A successful probe is reused for every job; an empty result is re-probed after
+    SYSTEM_CUDA_RETRY_SECONDS.
+    """
+    global _system_cuda_cache
+    now = time.monotonic()
+    if _system_cuda_cache is not None:
+        cached_env, probed_at, cached_paths = _system_cuda_cache
+        if cached_env is env and (cached_paths or now - probed_at < SYSTEM_CUDA_RETRY_SECONDS):
+            return list(cached_paths)
+
+    discovered = _probe_system_cuda_lib_paths(env)
+    _system_cuda_cache = (env, now, discovered)
+    return list(discovered)
+
+
+def _probe_system_cuda_lib_paths(env: _EnvConfig) -> list[str]:
     """
     Detect CUDA libraries available on the host for engines that bundle their own interpreter (InsightFace).
     Priority order:
@@ -176,11 +260,8 @@ def _discover_system_cuda_lib_paths(env: _EnvConfig) -> list[str]:
     """
     explicit_paths = env.get_str("STEP5_CUDA_LIB_PATH", "").strip()
     if explicit_paths:
-        resolved = [
-            str(Path(p.strip()).expanduser())
-            for p in explicit_paths.split(":")
-            if p.strip() and Path(p.strip()).expanduser().exists()
-        ]
+        explicit = [Path(p.strip()).expanduser() for p in explicit_paths.split(":") if p.strip()]
+        resolved = [str(path) for path, exists in zip(explicit, _paths_exist(explicit)) if exists]
         if resolved:
             return resolved
 
@@ -192,22 +273,26 @@ def _discover_system_cuda_lib_paths(env: _EnvConfig) -> list[str]:
     for default_path in SYSTEM_CUDA_DEFAULTS:
         candidates.append(Path(default_path))
 
-    discovered: list[str] = []
-    for base_dir in candidates:
-        if not base_dir.exists():
-            continue
-        for sub in ("lib64", "targets/x86_64-linux/lib"):
-            candidate = base_dir / sub
-            if candidate.exists():
-                discovered.append(str(candidate))
+    # A lib dir existing implies its base dir exists, so every probe can be issued at once.
+    lib_dirs = [base_dir / sub for base_dir in candidates for sub in ("lib64", "targets/x86_64-linux/lib")]
     debian_cuda = Path("/usr/lib/x86_64-linux-gnu")
-    if debian_cuda.exists():
-        expected = ["libcufft.so.11", "libcublas.so.12"]
-        if all((debian_cuda / lib_name).exists() for lib_name in expected):
-            discovered.append(str(debian_cuda))
+    debian_libs = [debian_cuda / lib_name for lib_name in ("libcufft.so.11", "libcublas.so.12")]
+    exists = _paths_exist(lib_dirs + debian_libs)
+
+    discovered = [str(path) for path, found in zip(lib_dirs, exists) if found]
+    if all(exists[len(lib_dirs):]):
+        discovered.append(str(debian_cuda))
     return discovered
 
 
+def _paths_exist(paths: list[Path]) -> list[bool]:
+    """Stat candidate paths concurrently so a slow mount does not serialize every probe."""
+    if len(paths) <= 1:
+        return [path.exists() for path in paths]
+    with ThreadPoolExecutor(max_workers=min(CUDA_PROBE_MAX_WORKERS, len(paths))) as pool:
+        return list(pool.map(Path.exists, paths))
+
+
 # --- CONFIGURATION DU LOGGER ---
 LOG_DIR = BASE_DIR / "logs" / "step5"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -233,6 +318,16 @@ CPU_OPTIMIZED_CONFIG = {
     "mp_max_distance_tracking": 80,
 }
 
+# The worker CLI shape is static: booleans are store_true flags, everything else is "--key value".
+_BOOL_FLAG_KEYS = tuple(k for k, v in WORKER_CONFIG_TEMPLATE.items() if isinstance(v, bool))
+_VALUE_ARG_KEYS = tuple(k for k, v in WORKER_CONFIG_TEMPLATE.items() if not isinstance(v, bool)) + (
+    "mp_num_workers_internal",
+)
+_FLAG_NAMES = {k: f"--{k}" for k in _BOOL_FLAG_KEYS + _VALUE_ARG_KEYS}
+
+
+# Pipe buffer for worker stdout: a burst of log lines is drained with a single read() syscall.
+WORKER_STDOUT_BUFSIZE = 64 * 1024
 
 _DEFAULT_SUBPROCESS_ENV: dict[str, str] = {
     'OMP_NUM_THREADS': '1',
@@ -262,54 +357,74 @@ def _collect_cuda_lib_paths(worker_python: Path, engine_norm: str) -> list[str]:
     return cuda_paths
 
 
-def _apply_ld_library_path(env: dict[str, str], extra_paths: list[str]) -> None:
-    if not extra_paths:
-        return
-    extra_ld_path = ":".join(extra_paths)
-    existing_ld_path = env.get("LD_LIBRARY_PATH", "")
-    env["LD_LIBRARY_PATH"] = (
-        f"{extra_ld_path}:{existing_ld_path}" if existing_ld_path else extra_ld_path
-    )
+# Static overrides merged once; os.environ wins, matching the former setdefault() semantics.
+_BASE_SUBPROCESS_ENV: dict[str, str] = {**_DEFAULT_SUBPROCESS_ENV, **os.environ}
+
+
+def _ld_library_path_for(worker_python: str, engine_norm: str) -> Optional[str]:
+    """Return the LD_LIBRARY_PATH to inject for a worker interpreter, or None if no CUDA libs were found."""
+    cuda_paths = _collect_cuda_lib_paths(Path(worker_python), engine_norm)
+    if not cuda_paths:
+        return None
+    extra_ld_path = ":".join(cuda_paths)
+    existing_ld_path = _BASE_SUBPROCESS_ENV.get("LD_LIBRARY_PATH", "")
+    return f"{extra_ld_path}:{existing_ld_path}" if existing_ld_path else extra_ld_path
 
 
 def _build_subprocess_env(worker_python: Path, engine_norm: str) -> dict[str, str]:
-    env = os.environ.copy()
-    cuda_paths = _collect_cuda_lib_paths(worker_python, engine_norm)
-    if cuda_paths:
-        _apply_ld_library_path(env, cuda_paths)
-        logging.info("[MANAGER] Injected CUDA library paths for ONNX Runtime")
+    ld_library_path = _ld_library_path_for(str(worker_python), engine_norm)
+    if ld_library_path is None:
+        return dict(_BASE_SUBPROCESS_ENV)
+    logging.info("[MANAGER] Injected CUDA library paths for ONNX Runtime")
+    return _BASE_SUBPROCESS_ENV | {"LD_LIBRARY_PATH": ld_library_path}
 
-    for key, value in _DEFAULT_SUBPROCESS_ENV.items():
-        env.setdefault(key, value)
-    return env
+
+# Worker progress lines: "[Progression]|<percent>|<frame>|<total_frames>".
+_PROGRESS_LINE_RE = re.compile(rb"\[Progression\]\|(\d+)\|")
 
 
 def log_reader_thread(process, video_name, progress_map, lock):
+    """Pump the worker's binary stdout; only progress lines are parsed."""
     if process.stdout:
-        for line in iter(process.stdout.readline, ''):
-            line = line.strip()
-            logging.info(f"[{video_name}] {line}")
-            if line.startswith("[Progression]|"):
+        log_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+        for raw in iter(process.stdout.readline, b''):
+            if log_enabled:
+                logging.info("[%s] %s", video_name, raw.decode('utf-8', 'replace').strip())
+            match = _PROGRESS_LINE_RE.match(raw)
+            if match:
+                percent = int(match.group(1))
+                with lock:
+                    progress_map[video_name] = f"{percent}%"
                 try:
-                    _, percent, _, _ = line.split('|')
-                    with lock:
-                        progress_map[video_name] = f"{int(percent)}%"
-                    try:
-                        print(f"{video_name}: {int(percent)}%", flush=True)
-                    except Exception:
-                        pass
-                except:
+                    print(f"{video_name}: {percent}%", flush=True)
+                except Exception:
                     pass
         process.stdout.close()
 
 
-def monitor_progress(processes, progress_map, lock, total_jobs_to_run):
-    while len(processes) < total_jobs_to_run or any(p.poll() is None for p in processes.values()):
+def _load_videos_json(json_path: Path):
+    """Parse the videos manifest, using orjson's C parser when it is installed."""
+    if orjson is not None:
+        return orjson.loads(json_path.read_bytes())
+    with open(json_path, 'r') as f:
+        return json.load(f)
+
+
+def monitor_progress(processes, progress_map, lock, total_jobs_to_run, stop_event=None):
+    last_line = None
+    while (stop_event is None or not stop_event.is_set()) and (
+        len(processes) < total_jobs_to_run or any(p.poll() is None for p in processes.values())
+    ):
         time.sleep(1)
         with lock:
             progress_copy = progress_map.copy()
         progress_parts = [f"{name}: {status}" for name, status in sorted(progress_copy.items())]
-        if progress_parts: print(f"[Progression-MultiLine]{' || '.join(progress_parts)}", flush=True)
+        if not progress_parts:
+            continue
+        line = f"[Progression-MultiLine]{' || '.join(progress_parts)}"
+        if line != last_line:
+            print(line, flush=True)
+            last_line = line
     time.sleep(1)
 
 
@@ -320,13 +435,11 @@ def launch_worker_process(video_path, use_gpu, internal_workers=1, tracking_engi
 
     config = WORKER_CONFIG_TEMPLATE.copy()
 
-    engine_norm = (str(tracking_engine).strip().lower() if tracking_engine is not None else "")
-    if engine_norm in {"mediapipe", "mediapipe_landmarker"}:
-        engine_norm = ""
+    engine_norm = _normalize_engine(tracking_engine)
 
-    gpu_capable_engines = {"openseeface", "opencv_yunet_pyfeat", "insightface"}
-    
-    if engine_norm and engine_norm not in gpu_capable_engines:
+    caps = ENGINE_CAPABILITIES.get(engine_norm, DEFAULT_ENGINE_CAPS)
+
+    if not caps.gpu_capable:
         if use_gpu:
             logging.info(f"Engine {engine_norm} not GPU-capable, forcing CPU mode")
         use_gpu = False
@@ -336,22 +449,19 @@ def launch_worker_process(video_path, use_gpu, internal_workers=1, tracking_engi
         config["mp_num_workers_internal"] = internal_workers
 
         if internal_workers > 1:
-            worker_script = "process_video_worker_multiprocessing.py"
+            worker_script_path = WORKER_SCRIPTS["multi"]
             logging.info(f"Using multiprocessing worker with {internal_workers} processes")
         else:
-            worker_script = "process_video_worker.py"
+            worker_script_path = WORKER_SCRIPTS["single"]
             logging.info("Using single-threaded CPU worker")
 
         logging.info(f"Applied CPU optimizations: lower confidence thresholds for better detection rate")
     else:
-        worker_script = "process_video_worker.py"
+        worker_script_path = WORKER_SCRIPTS["single"]
         logging.info("Using GPU worker with sequential processing")
         if step5_enable_object_detection and internal_workers > 1:
             config["mp_num_workers_internal"] = internal_workers
 
-    models_dir_path = Path(__file__).resolve().parent / "models"
-    worker_script_path = Path(__file__).resolve().parent / worker_script
-
     worker_python_override_eos = ENV.get_optional_str("STEP5_EOS_ENV_PYTHON")
     worker_python_override_insightface = ENV.get_optional_str("STEP5_INSIGHTFACE_ENV_PYTHON")
     worker_python = TRACKING_ENV_PYTHON
@@ -390,21 +500,17 @@ def launch_worker_process(video_path, use_gpu, internal_workers=1, tracking_engi
                     f"({TF_GPU_ENV_PYTHON}). Falling back to tracking_env."
                 )
 
-    command_args = [str(worker_python), str(worker_script_path), video_path, "--models_dir", str(models_dir_path)]
+    command_args = [str(worker_python), str(worker_script_path), video_path, "--models_dir", str(MODELS_DIR)]
     if use_gpu: command_args.append("--use_gpu")
 
     if engine_norm:
         command_args.extend(["--tracking_engine", engine_norm])
 
-    for key, value in config.items():
-        if key == "mp_num_workers_internal" and use_gpu and not (step5_enable_object_detection and internal_workers > 1):
-            continue
-        if isinstance(value, bool):
-            if value:
-                command_args.append(f"--{key}")
-            continue
+    command_args.extend(_FLAG_NAMES[key] for key in _BOOL_FLAG_KEYS if config[key])
+    for key in _VALUE_ARG_KEYS:
+        value = config.get(key)
         if value is not None:
-            command_args.extend([f"--{key}", str(value)])
+            command_args.extend((_FLAG_NAMES[key], str(value)))
 
     if (not use_gpu) and internal_workers > 1:
         command_args.extend(["--chunk_size", "0"])  # 0 = adaptive in worker
@@ -416,9 +522,7 @@ def launch_worker_process(video_path, use_gpu, internal_workers=1, tracking_engi
             command_args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
+            bufsize=WORKER_STDOUT_BUFSIZE,
             env=env,
         )
         return p
@@ -439,11 +543,10 @@ def run_job_and_monitor(job_info, processes, progress_map, lock):
             processes[video_name] = p
             progress_map[video_name] = "Démarrage..."
 
-        reader_thread = threading.Thread(target=log_reader_thread, args=(p, video_name, progress_map, lock),
-                                         daemon=True)
-        reader_thread.start()
+        # The resource thread pumps stdout itself: jobs run one at a time per resource,
+        # so a dedicated reader thread per job would only sit blocked next to p.wait().
+        log_reader_thread(p, video_name, progress_map, lock)
         p.wait()
-        reader_thread.join(timeout=1)
 
         try:
             if p.returncode == 0:
@@ -455,7 +558,19 @@ def run_job_and_monitor(job_info, processes, progress_map, lock):
 
 
 
-def resource_worker_loop(resource_name, use_gpu, videos_deque, deque_lock, processes, progress_map, lock):
+def _terminate_running_jobs(processes, lock):
+    """Send SIGTERM to every worker subprocess that is still running."""
+    with lock:
+        running = [p for p in processes.values() if p.poll() is None]
+    for p in running:
+        try:
+            p.terminate()
+        except OSError:
+            pass
+
+
+def resource_worker_loop(resource_name, use_gpu, videos_deque, deque_lock, processes, progress_map, lock,
+                         stop_event=None):
     """Continuously pull videos from the shared deque and process them on the given resource.
 
     Args:
@@ -463,11 +578,12 @@ def resource_worker_loop(resource_name, use_gpu, videos_deque, deque_lock, proce
         use_gpu (bool): Whether to use GPU for the worker process.
         videos_deque (collections.deque): Shared queue of video paths to process.
         deque_lock (threading.Lock): Lock protecting access to the shared deque.
-        processes (OrderedDict): Shared mapping of video_name -> subprocess.Popen.
-        progress_map (OrderedDict): Shared mapping of video_name -> progress string.
+        processes (dict): Shared mapping of video_name -> subprocess.Popen.
+        progress_map (dict): Shared mapping of video_name -> progress string.
         lock (threading.Lock): Lock protecting shared maps.
+        stop_event (threading.Event, optional): When set, stop pulling new videos.
     """
-    while True:
+    while stop_event is None or not stop_event.is_set():
         with deque_lock:
             if videos_deque:
                 video_path = videos_deque.popleft()
@@ -512,7 +628,7 @@ def main():
     except Exception:
         pass
 
-    _engine_norm = (str(args.tracking_engine).strip().lower() if args.tracking_engine is not None else "")
+    _engine_norm = _normalize_engine(args.tracking_engine)
     
     gpu_enabled_global = ENV.get_str('STEP5_ENABLE_GPU', '0').strip() == '1'
     gpu_engines_str = ENV.get_str('STEP5_GPU_ENGINES', '').strip().lower()
@@ -520,18 +636,18 @@ def main():
     _log_env_snapshot()
     
     engine_normalized = _engine_norm if _engine_norm else "mediapipe_landmarker"
-    if engine_normalized in {"mediapipe", "mediapipe_landmarker"}:
-        engine_normalized = "mediapipe_landmarker"
+    caps = ENGINE_CAPABILITIES.get(_engine_norm, DEFAULT_ENGINE_CAPS)
     
     engine_supports_gpu = False
     if gpu_enabled_global and not args.disable_gpu:
-        if engine_normalized == "insightface":
+        # GPU mode is reserved for GPU-only engines (InsightFace).
+        if caps.gpu_only:
             if engine_normalized in gpu_engines or 'all' in gpu_engines:
                 engine_supports_gpu = True
                 logging.info(f"GPU mode requested for engine: {engine_normalized}")
                 
                 try:
-                    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+                    sys.path.insert(0, str(BASE_DIR))
                     from config.settings import Config
                     gpu_status = Config.check_gpu_availability()
                     
@@ -562,7 +678,7 @@ def main():
             logging.info(f"GPU mode is reserved for InsightFace only. Engine '{engine_normalized}' will run in CPU-only mode.")
             args.disable_gpu = True
     
-    if _engine_norm in {"opencv_haar", "opencv_yunet", "eos"}:
+    if caps.cpu_only:
         if not args.disable_gpu:
             args.disable_gpu = True
             logging.info(f"Engine {_engine_norm} does not support GPU, forcing CPU-only mode")
@@ -572,15 +688,14 @@ def main():
     else:
         logging.info(f"CPU-only mode (GPU disabled or not supported for this engine)")
 
-    if _engine_norm == "insightface" and (args.disable_gpu or not engine_supports_gpu):
+    if caps.gpu_only and (args.disable_gpu or not engine_supports_gpu):
         logging.error(
             "InsightFace engine is GPU-only, but GPU mode is disabled or not authorized. "
             "Set STEP5_ENABLE_GPU=1 and include 'insightface' in STEP5_GPU_ENGINES."
         )
         sys.exit(1)
 
-    with open(args.videos_json_path, 'r') as f:
-        data = json.load(f)
+    data = _load_videos_json(Path(args.videos_json_path))
     
     if isinstance(data, list):
         videos_list = data
@@ -605,44 +720,55 @@ def main():
     if args.disable_gpu:
         logging.info("Mode FULL CPU activé: le worker GPU est désactivé")
 
-    processes, video_progress_map, progress_lock = OrderedDict(), OrderedDict(), threading.Lock()
-
-    monitor_thread = threading.Thread(target=monitor_progress,
-                                      args=(processes, video_progress_map, progress_lock, total_jobs), daemon=True)
-    monitor_thread.start()
-
+    processes, video_progress_map, progress_lock = {}, {}, threading.Lock()
     deque_lock = threading.Lock()
+    stop_event = threading.Event()
 
-    threads = []
+    loop_specs = []
     if not args.disable_gpu:
-        gpu_thread = threading.Thread(
-            target=resource_worker_loop,
-            args=("GPU", True, videos_to_process, deque_lock, processes, video_progress_map, progress_lock),
-            daemon=True,
-        )
-        threads.append(gpu_thread)
-    if _engine_norm != "insightface":
-        cpu_thread = threading.Thread(
-            target=resource_worker_loop,
-            args=("CPU", False, videos_to_process, deque_lock, processes, video_progress_map, progress_lock),
-            daemon=True,
-        )
-        threads.append(cpu_thread)
+        loop_specs.append(("GPU", True))
+    if not caps.gpu_only:
+        loop_specs.append(("CPU", False))
     else:
         logging.info("InsightFace is GPU-only: CPU worker thread disabled")
 
     if args.disable_gpu:
         workers_label = "CPU seul"
     else:
-        workers_label = "GPU seul" if _engine_norm == "insightface" else "GPU et CPU"
+        workers_label = "GPU seul" if caps.gpu_only else "GPU et CPU"
     logging.info("Lancement des workers: " + workers_label)
-    for t in threads:
-        t.start()
-
-    for t in threads:
-        t.join()
 
-    monitor_thread.join(timeout=2)
+    pool = ThreadPoolExecutor(max_workers=len(loop_specs) + 1)
+    completed = False
+    try:
+        pool.submit(monitor_progress, processes, video_progress_map, progress_lock, total_jobs, stop_event)
+        loop_futures = [
+            pool.submit(
+                resource_worker_loop,
+                resource_name, use_gpu, videos_to_process, deque_lock,
+                processes, video_progress_map, progress_lock, stop_event,
+            )
+            for resource_name, use_gpu in loop_specs
+        ]
+        done, _ = wait(loop_futures, return_when=FIRST_EXCEPTION)
+        if any(future.exception() is not None for future in done):
+            logging.error("[Scheduler] A worker loop crashed, stopping the remaining loops")
+            stop_event.set()
+        wait(loop_futures)
+        completed = True
+    finally:
+        # Also unblocks the monitor when some jobs never started (launch failure or abort).
+        # On KeyboardInterrupt or an unexpected error, don't block on the queued videos:
+        # the loops stop pulling new ones and pending work is cancelled. The pool threads
+        # are still joined at interpreter exit, so the running workers are terminated too.
+        stop_event.set()
+        if not completed:
+            _terminate_running_jobs(processes, progress_lock)
+        pool.shutdown(wait=completed, cancel_futures=not completed)
+
+    for future in loop_futures:
+        if future.exception() is not None:
+            logging.error(f"[Scheduler] Worker loop error: {future.exception()!r}")
 
     success_count = sum(1 for p in processes.values() if p.returncode == 0)
     logging.info(f"--- FIN DU GESTIONNAIRE ---")
@@ -1,11 +1,43 @@
+"""
+Étape 6 - Réduction des JSON de tracking et d'audio de chaque projet.
+
+Variables d'environnement:
+\- STEP6_WORKERS: projets réduits en parallèle, défaut de --workers (1 par défaut)
+\- JSON_REDUCER_PRETTY=1: JSON indentés, défaut de --pretty
+"""
+
 import os
 import sys
 import json
 import argparse
+import functools
 import logging
+import logging.handlers
+import mmap
+import multiprocessing
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Dépendances optionnelles (requirements.txt). Sans orjson, lecture et écriture passent par le
+# module json standard ; sans ijson, les gros JSON sont lus en entier ; sans fastjsonschema,
+# --validate est refusé au démarrage.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -13,6 +45,17 @@ logger.setLevel(logging.INFO)
 VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi", ".mkv", ".webm")
 AUDIO_SUFFIX = "_audio.json"
 TRACKING_SUFFIX = "_tracking.json"
+# Manifeste (par dossier docs/) des fichiers déjà réduits, pour ne pas les retraiter.
+REDUCTION_CACHE_NAME = ".json_reducer_cache.json"
+
+# Au-delà de cette taille, les JSON de tracking sont réduits en streaming (si ijson est installé).
+_STREAMING_MIN_BYTES = 64 * 1024 * 1024
+
+# Tampon des lectures JSON (le défaut Python de 8 KiB multiplie les appels système).
+_IO_BUFFER_SIZE = 1024 * 1024
+
+# Au-delà de cette taille, orjson parse directement le fichier mappé en mémoire (pas de copie en bytes).
+_MMAP_MIN_BYTES = 1024 * 1024
 
 _ENRICHMENT_SAMPLE_MAX_FRAMES = 50
 _ENRICHMENT_SAMPLE_MAX_OBJECTS_PER_FRAME = 20
@@ -24,55 +67,158 @@ _TRACKING_ENRICH_FIELDS = (
     "label",
 )
 
+# Forme exacte des frames/objets produits par reduce_video_json.
+_REDUCED_FRAME_KEYS = frozenset(("frame", "tracked_objects"))
+_REDUCED_OBJECT_CORE_KEYS = frozenset((
+    "id",
+    "centroid_x",
+    "source",
+    "label",
+    "confidence",
+    "active_speakers",
+))
+_REDUCED_OBJECT_KEYS = _REDUCED_OBJECT_CORE_KEYS | {"bbox_width", "bbox_height"}
+
 
-def _extract_top_level_metadata(data: Dict[str, Any]) -> Tuple[Optional[float], Optional[int]]:
-    fps = None
-    total_frames = None
+def _safe_int(value: Any) -> Optional[int]:
+    """int(value), ou None si la valeur est absente ou non convertible (sans try pour un int).
 
-    raw_fps = data.get("fps")
-    raw_total = data.get("total_frames")
-    if raw_fps is not None:
-        try:
-            fps = float(raw_fps)
-        except Exception:
-            fps = None
-    if raw_total is not None:
-        try:
-            total_frames = int(raw_total)
-        except Exception:
-            total_frames = None
+    `type(...) is int` et non isinstance : un bool doit devenir 0/1, comme avec int(value).
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """float(value), ou None si la valeur est absente ou non convertible (sans try pour un float)."""
+    if isinstance(value, float):
+        return value
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _extract_top_level_metadata(data: Dict[str, Any]) -> Tuple[Optional[float], Optional[int]]:
+    fps = _safe_float(data.get("fps"))
+    total_frames = _safe_int(data.get("total_frames"))
 
     meta = data.get("metadata")
     if isinstance(meta, dict):
-        if fps is None and meta.get("fps") is not None:
-            try:
-                fps = float(meta.get("fps"))
-            except Exception:
-                fps = None
-        if total_frames is None and meta.get("total_frames") is not None:
-            try:
-                total_frames = int(meta.get("total_frames"))
-            except Exception:
-                total_frames = None
+        if fps is None:
+            fps = _safe_float(meta.get("fps"))
+        if total_frames is None:
+            total_frames = _safe_int(meta.get("total_frames"))
 
     return fps, total_frames
 
 
-def _write_json_atomically(path: Path, payload: Dict[str, Any]) -> None:
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
-    os.replace(tmp_path, path)
+def _load_json(path: Path) -> Any:
+    """Lit un fichier JSON, via le parseur C d'orjson lorsqu'il est installé."""
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        mm = None
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Certains montages (FUSE, partages réseau) ne supportent pas mmap : lecture classique.
+                mm = None
+        if mm is not None:
+            with mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    raw = mm[:]
+                finally:
+                    view.release()
+            return json.loads(raw)
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson est strict (ex: refuse NaN) : on laisse trancher le parseur stdlib.
+            pass
+    return json.loads(raw)
+
+
+def _dumps_json(payload: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Sérialise en JSON compact (lu tel quel par After Effects), ou indenté si pretty.
+
+    Avec orjson, les flottants NaN/Infinity sont écrits `null` (JSON standard, accepté par
+    JSON.parse) ; le repli json.dumps les écrit toujours `NaN`/`Infinity`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            # orjson refuse certains contenus (ex: entiers > 64 bits) : repli sur le sérialiseur stdlib.
+            pass
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
-def _is_reduced_tracking_schema(data: Dict[str, Any]) -> bool:
-    frames = data.get("frames_analysis")
-    return isinstance(frames, list)
+def _write_json_atomically(path: Path, payload: Dict[str, Any], pretty: bool = False) -> None:
+    """Écrit dans un fichier temporaire puis le renomme : la cible n'est jamais tronquée."""
+    _write_bytes_atomically(path, _dumps_json(payload, pretty))
 
 
-def _is_raw_tracking_schema(data: Dict[str, Any]) -> bool:
-    frames = data.get("frames")
-    return isinstance(frames, list)
+def _write_json_if_changed(path: Path, payload: Dict[str, Any], pretty: bool = False) -> bool:
+    """
+    Comme _write_json_atomically, mais n'écrit pas si le fichier contient déjà exactement
+    ce JSON (ex: fichier déjà réduit lors d'une exécution précédente). Retourne True si écrit.
+    """
+    data = _dumps_json(payload, pretty)
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    _write_bytes_atomically(path, data)
+    return True
+
+
+def _write_bytes_atomically(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        # Données déjà sérialisées : écriture directe sur le descripteur, sans tampon Python.
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # Le contenu doit être sur disque avant le renommage, sinon un crash peut laisser un fichier vide.
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_schema_validator(schema_path: str):
+    """Compile le schéma JSON une seule fois par processus (fastjsonschema génère du code Python).
+
+    use_default=False : la validation ne doit pas injecter les valeurs `default` du schéma dans la sortie.
+    """
+    return fastjsonschema.compile(_load_json(Path(schema_path)), use_default=False)
 
 
 def setup_logging(log_dir: str):
@@ -95,10 +241,54 @@ def setup_logging(log_dir: str):
     logger.addHandler(ch)
     logger.propagate = False
 
-    logger.info(f"Log file initialized: {log_path}")
+    logger.info("Log file initialized: %s", log_path)
     return log_path
 
 
+def _reduce_tracked_object(obj: Dict[str, Any]) -> Dict[str, Any]:
+    # Appelé pour chaque détection : chaque clé n'est lue qu'une fois.
+    get = obj.get
+
+    # Extraction sécurisée de active_speakers (la source audio est prioritaire).
+    # Cas courant : speaking_sources.audio est présent, un seul accès indexé suffit.
+    try:
+        audio = obj["speaking_sources"]["audio"]
+    except (KeyError, TypeError):
+        audio = None
+    if audio and isinstance(audio, dict):
+        active_speakers = audio.get("active_speakers", [])
+    else:
+        active_speakers = get("active_speakers")
+        if not isinstance(active_speakers, list):
+            active_speakers = []
+
+    new_obj = {
+        "id": get("id"),
+        "centroid_x": get("centroid_x"),
+        "source": get("source"),
+        "label": get("label"),
+        "confidence": get("confidence"),
+        "active_speakers": active_speakers,
+    }
+
+    # Inclure la taille du bbox si disponible (ajout depuis l'étape 5)
+    bbox_w = get("bbox_width")
+    bbox_h = get("bbox_height")
+    if bbox_w is not None and bbox_h is not None:
+        new_obj["bbox_width"] = bbox_w
+        new_obj["bbox_height"] = bbox_h
+
+    return new_obj
+
+
+def _reduce_tracking_frame(frame: Dict[str, Any]) -> Dict[str, Any]:
+    tracked_objects = frame.get("tracked_objects")
+    return {
+        "frame": frame.get("frame"),
+        "tracked_objects": [_reduce_tracked_object(obj) for obj in tracked_objects or ()]
+    }
+
+
 def reduce_video_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Réduit un objet JSON de données vidéo pour ne conserver que les clés
@@ -106,59 +296,30 @@ def reduce_video_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     fps, total_frames = _extract_top_level_metadata(data)
 
-    frames_in: Optional[List[Dict[str, Any]]] = None
-    if _is_raw_tracking_schema(data):
-        frames_in = data.get("frames")
-    elif _is_reduced_tracking_schema(data):
+    # Schéma brut (étape 5) : "frames" ; schéma déjà réduit : "frames_analysis".
+    frames_in = data.get("frames")
+    if not isinstance(frames_in, list):
         frames_in = data.get("frames_analysis")
-    else:
-        return None
+        if not isinstance(frames_in, list):
+            return None
+        if _is_normalized_reduced_tracking(frames_in):
+            # Relance sur un fichier déjà réduit et enrichi : les frames sont reprises telles quelles.
+            return _assemble_reduced_tracking(frames_in, fps, total_frames)
 
-    new_frames_data: List[Dict[str, Any]] = []
-    max_frame_seen: int = 0
-    for frame in frames_in or []:
-        new_tracked_objects = []
-        if "tracked_objects" in frame and frame["tracked_objects"] is not None:
-            for obj in frame["tracked_objects"]:
-                # Initialisation de l'objet simplifié
-                new_obj = {
-                    "id": obj.get("id"),
-                    "centroid_x": obj.get("centroid_x"),
-                    "source": obj.get("source"),
-                    "label": obj.get("label"),
-                    "confidence": obj.get("confidence"),
-                    "active_speakers": []  # Valeur par défaut
-                }
-
-                # Inclure la taille du bbox si disponible (ajout depuis l'étape 5)
-                bbox_w = obj.get("bbox_width")
-                bbox_h = obj.get("bbox_height")
-                if bbox_w is not None and bbox_h is not None:
-                    new_obj["bbox_width"] = bbox_w
-                    new_obj["bbox_height"] = bbox_h
-
-                # Extraction sécurisée de active_speakers
-                if isinstance(obj.get("active_speakers"), list):
-                    new_obj["active_speakers"] = obj.get("active_speakers") or []
-                if (obj.get("speaking_sources") and
-                        isinstance(obj["speaking_sources"], dict) and
-                        obj["speaking_sources"].get("audio") and
-                        isinstance(obj["speaking_sources"]["audio"], dict)):
-                    new_obj["active_speakers"] = obj["speaking_sources"]["audio"].get("active_speakers", [])
-
-                new_tracked_objects.append(new_obj)
-
-        frame_num = frame.get("frame")
-        try:
-            if frame_num is not None:
-                max_frame_seen = max(max_frame_seen, int(frame_num))
-        except Exception:
-            pass
+    new_frames_data = [_reduce_tracking_frame(frame) for frame in frames_in]
+    return _assemble_reduced_tracking(new_frames_data, fps, total_frames)
 
-        new_frames_data.append({
-            "frame": frame_num,
-            "tracked_objects": new_tracked_objects
-        })
+
+def _assemble_reduced_tracking(
+    new_frames_data: List[Dict[str, Any]],
+    fps: Optional[float],
+    total_frames: Optional[int],
+) -> Dict[str, Any]:
+    max_frame_seen: int = 0
+    for new_frame in new_frames_data:
+        frame_i = _safe_int(new_frame["frame"])
+        if frame_i is not None and frame_i > max_frame_seen:
+            max_frame_seen = frame_i
 
     if total_frames is None and max_frame_seen > 0:
         total_frames = max_frame_seen
@@ -171,6 +332,140 @@ def reduce_video_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return out
 
 
+class _InMemoryLoadPreferred(Exception):
+    """Levée par _stream_reduce_array quand le document doit plutôt être chargé en entier."""
+
+
+def _stream_reduce_array(
+    path: Path,
+    array_key: str,
+    reduce_item: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    in_memory_keys: AbstractSet[str] = frozenset(),
+) -> Optional[Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]]:
+    """
+    Parcourt un JSON objet avec ijson en réduisant chaque élément du tableau array_key
+    dès qu'il est parsé : la mémoire crête est bornée par un élément brut, pas par le
+    document complet.
+
+    Retourne (clés de premier niveau hors tableau, éléments réduits), ou None si le
+    document n'est pas un objet. Les éléments réduits valent None si le tableau est absent.
+    Lève _InMemoryLoadPreferred dès qu'une clé de premier niveau de in_memory_keys apparaît.
+    """
+    top_level: Dict[str, Any] = {}
+    reduced_items: Optional[List[Dict[str, Any]]] = None
+    item_prefix = f"{array_key}.item"
+    current_key: Optional[str] = None
+    builder = None
+
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        for prefix, event, value in ijson.parse(f, buf_size=_IO_BUFFER_SIZE, use_float=True):
+            if prefix == "":
+                if builder is not None:
+                    top_level[current_key] = builder.value
+                    builder = None
+                if event == "map_key":
+                    if value in in_memory_keys:
+                        raise _InMemoryLoadPreferred(value)
+                    current_key = value
+                    if current_key != array_key:
+                        builder = ijson.ObjectBuilder()
+                elif event not in ("start_map", "end_map"):
+                    return None
+                continue
+
+            if current_key != array_key:
+                builder.event(event, value)
+            elif prefix == array_key:
+                if event == "start_array":
+                    reduced_items = []
+                elif event != "end_array":
+                    top_level[array_key] = value
+            elif prefix == item_prefix and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event == "end_map":
+                    reduced = reduce_item(builder.value)
+                    if reduced is not None:
+                        reduced_items.append(reduced)
+                    builder = None
+
+    return top_level, reduced_items
+
+
+def _stream_reduce_video_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Équivalent streaming de reduce_video_json(_load_json(path)) basé sur ijson.
+
+    Seule la sortie brute de l'étape 5 ("frames") est streamée : un tracking déjà réduit
+    ("frames_analysis", clé écrite en premier) est chargé en entier, pour profiter du
+    parseur orjson et de la reprise telle quelle des frames déjà réduites.
+    """
+    streamed = _stream_reduce_array(path, "frames", _reduce_tracking_frame, frozenset(("frames_analysis",)))
+    if streamed is None:
+        return None
+    top_level, reduced_frames = streamed
+    if reduced_frames is None:
+        return reduce_video_json(top_level)
+    fps, total_frames = _extract_top_level_metadata(top_level)
+    return _assemble_reduced_tracking(reduced_frames, fps, total_frames)
+
+
+def _stream_reduce_audio_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Équivalent streaming de reduce_audio_json(_load_json(path)) basé sur ijson."""
+    streamed = _stream_reduce_array(path, "frames_analysis", _reduce_audio_frame)
+    if streamed is None:
+        return None
+    top_level, reduced_frames = streamed
+    if reduced_frames is None:
+        return reduce_audio_json(top_level)
+    fps, total_frames = _extract_top_level_metadata(top_level)
+    return _assemble_reduced_audio(reduced_frames, fps, total_frames)
+
+
+def _load_and_reduce(
+    path: Path,
+    reduce: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    stream_reduce: Callable[[Path], Optional[Dict[str, Any]]],
+) -> Optional[Dict[str, Any]]:
+    if ijson is not None and path.stat().st_size >= _STREAMING_MIN_BYTES:
+        try:
+            return stream_reduce(path)
+        except ijson.JSONError:
+            # ijson est strict (ex: refuse NaN) : repli sur le chargement en mémoire.
+            pass
+        except _InMemoryLoadPreferred:
+            pass
+    return reduce(_load_json(path))
+
+
+def _load_and_reduce_video_json(path: Path) -> Optional[Dict[str, Any]]:
+    return _load_and_reduce(path, reduce_video_json, _stream_reduce_video_json)
+
+
+def _load_and_reduce_audio_json(path: Path) -> Optional[Dict[str, Any]]:
+    return _load_and_reduce(path, reduce_audio_json, _stream_reduce_audio_json)
+
+
+def _reduce_audio_frame(frame_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    audio_info = frame_data.get("audio_info")
+    if audio_info is None:
+        return None
+
+    new_audio_info = {
+        "is_speech_present": audio_info.get("is_speech_present", False),
+        "active_speaker_labels": audio_info.get("active_speaker_labels", [])
+    }
+    timecode_sec = audio_info.get("timecode_sec")
+    if timecode_sec is not None:
+        new_audio_info["timecode_sec"] = timecode_sec
+
+    return {
+        "frame": frame_data.get("frame"),
+        "audio_info": new_audio_info
+    }
+
+
 def reduce_audio_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Réduit un objet JSON de données audio pour ne conserver que les clés
@@ -181,35 +476,26 @@ def reduce_audio_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
     fps, total_frames = _extract_top_level_metadata(data)
 
-    new_frames_analysis: List[Dict[str, Any]] = []
-    speaker_frame_counts: Dict[str, int] = {}
+    reduced_frames = (_reduce_audio_frame(frame_data) for frame_data in data["frames_analysis"])
+    new_frames_analysis = [frame for frame in reduced_frames if frame is not None]
+    return _assemble_reduced_audio(new_frames_analysis, fps, total_frames)
+
+
+def _assemble_reduced_audio(
+    new_frames_analysis: List[Dict[str, Any]],
+    fps: Optional[float],
+    total_frames: Optional[int],
+) -> Dict[str, Any]:
+    speaker_frame_counts: Counter = Counter()
     max_frame_seen: int = 0
-    for frame_data in data["frames_analysis"]:
-        if "audio_info" in frame_data and frame_data["audio_info"] is not None:
-            new_audio_info = {
-                "is_speech_present": frame_data["audio_info"].get("is_speech_present", False),
-                "active_speaker_labels": frame_data["audio_info"].get("active_speaker_labels", [])
-            }
-            if frame_data["audio_info"].get("timecode_sec") is not None:
-                new_audio_info["timecode_sec"] = frame_data["audio_info"].get("timecode_sec")
-
-            frame_num = frame_data.get("frame")
-            try:
-                if frame_num is not None:
-                    max_frame_seen = max(max_frame_seen, int(frame_num))
-            except Exception:
-                pass
-            new_frames_analysis.append({
-                "frame": frame_num,
-                "audio_info": new_audio_info
-            })
-
-            labels = new_audio_info.get("active_speaker_labels")
-            if isinstance(labels, list):
-                for label in labels:
-                    if not isinstance(label, str) or not label:
-                        continue
-                    speaker_frame_counts[label] = speaker_frame_counts.get(label, 0) + 1
+    for new_frame in new_frames_analysis:
+        frame_i = _safe_int(new_frame["frame"])
+        if frame_i is not None and frame_i > max_frame_seen:
+            max_frame_seen = frame_i
+
+        labels = new_frame["audio_info"]["active_speaker_labels"]
+        if isinstance(labels, list):
+            speaker_frame_counts.update(label for label in labels if isinstance(label, str) and label)
 
     if total_frames is None and max_frame_seen > 0:
         total_frames = max_frame_seen
@@ -221,8 +507,8 @@ def reduce_audio_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         out["total_frames"] = total_frames
     if speaker_frame_counts:
         out["speaker_stats"] = {
-            "unique_speakers": sorted(list(speaker_frame_counts.keys())),
-            "speaker_frame_counts": speaker_frame_counts,
+            "unique_speakers": sorted(speaker_frame_counts),
+            "speaker_frame_counts": dict(speaker_frame_counts),
         }
     return out
 
@@ -234,28 +520,10 @@ def _compute_temporal_alignment(
     if not reduced_audio:
         return None
 
-    v_total = reduced_tracking.get("total_frames")
-    a_total = reduced_audio.get("total_frames")
-    v_fps = reduced_tracking.get("fps")
-    a_fps = reduced_audio.get("fps")
-
-    try:
-        v_total_i = int(v_total) if v_total is not None else None
-    except Exception:
-        v_total_i = None
-    try:
-        a_total_i = int(a_total) if a_total is not None else None
-    except Exception:
-        a_total_i = None
-
-    try:
-        v_fps_f = float(v_fps) if v_fps is not None else None
-    except Exception:
-        v_fps_f = None
-    try:
-        a_fps_f = float(a_fps) if a_fps is not None else None
-    except Exception:
-        a_fps_f = None
+    v_total_i = _safe_int(reduced_tracking.get("total_frames"))
+    a_total_i = _safe_int(reduced_audio.get("total_frames"))
+    v_fps_f = _safe_float(reduced_tracking.get("fps"))
+    a_fps_f = _safe_float(reduced_audio.get("fps"))
 
     if v_total_i is None and a_total_i is None and v_fps_f is None and a_fps_f is None:
         return None
@@ -282,37 +550,60 @@ def _compute_temporal_alignment(
 def _resolve_tracking_paths(
     docs_path: Path,
     video_stem: str,
+    docs_files: AbstractSet[str],
 ) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
     preferred = docs_path / f"{video_stem}{TRACKING_SUFFIX}"
     legacy = docs_path / f"{video_stem}.json"
-    if preferred.exists():
-        fallback = legacy if legacy.exists() else None
+    if preferred.name in docs_files:
+        fallback = legacy if legacy.name in docs_files else None
         return preferred, preferred, fallback
-    if legacy.exists():
+    if legacy.name in docs_files:
         return legacy, preferred, None
     return None, None, None
 
 
+def _is_normalized_reduced_tracking(frames: List[Any]) -> bool:
+    """
+    Vrai si les frames ont déjà la forme produite par reduce_video_json et sont enrichies.
+
+    Chaque frame et chaque objet suivi sont vérifiés (clés exactes, liste active_speakers,
+    paire bbox complète) : les reprendre tels quels donne la même sortie qu'une réduction.
+    Seul le test d'enrichissement est échantillonné, comme dans _reduced_tracking_needs_enrichment.
+    """
+    if not frames:
+        return False
+    for frame in frames:
+        if not isinstance(frame, dict) or frame.keys() != _REDUCED_FRAME_KEYS:
+            return False
+        tracked = frame["tracked_objects"]
+        if not isinstance(tracked, list):
+            return False
+        for obj in tracked:
+            if not isinstance(obj, dict) or not isinstance(obj.get("active_speakers"), list):
+                return False
+            keys = obj.keys()
+            if keys == _REDUCED_OBJECT_KEYS:
+                if obj["bbox_width"] is None or obj["bbox_height"] is None:
+                    return False
+            elif keys != _REDUCED_OBJECT_CORE_KEYS:
+                return False
+    return not _reduced_tracking_needs_enrichment({"frames_analysis": frames})
+
+
 def _reduced_tracking_needs_enrichment(reduced_tracking: Dict[str, Any]) -> bool:
     frames = reduced_tracking.get("frames_analysis")
     if not isinstance(frames, list) or not frames:
         return False
 
-    sampled_frames = frames[:_ENRICHMENT_SAMPLE_MAX_FRAMES]
-    for frame in sampled_frames:
-        if not isinstance(frame, dict):
-            continue
-        tracked = frame.get("tracked_objects")
-        if not isinstance(tracked, list) or not tracked:
-            continue
-        sampled_objs = tracked[:_ENRICHMENT_SAMPLE_MAX_OBJECTS_PER_FRAME]
-        for obj in sampled_objs:
-            if not isinstance(obj, dict):
-                continue
-            for key in _TRACKING_ENRICH_FIELDS:
-                if key not in obj or obj.get(key) is None:
-                    return True
-    return False
+    # Vrai dès qu'un champ d'enrichissement manque (ou vaut None) sur un objet échantillonné.
+    return any(
+        obj.get(key) is None
+        for frame in frames[:_ENRICHMENT_SAMPLE_MAX_FRAMES]
+        if isinstance(frame, dict) and isinstance(frame.get("tracked_objects"), list)
+        for obj in frame["tracked_objects"][:_ENRICHMENT_SAMPLE_MAX_OBJECTS_PER_FRAME]
+        if isinstance(obj, dict)
+        for key in _TRACKING_ENRICH_FIELDS
+    )
 
 
 def _index_reduced_tracking_by_frame_and_id(reduced_tracking: Dict[str, Any]) -> Dict[int, Dict[str, Dict[str, Any]]]:
@@ -324,22 +615,17 @@ def _index_reduced_tracking_by_frame_and_id(reduced_tracking: Dict[str, Any]) ->
     for frame in frames:
         if not isinstance(frame, dict):
             continue
-        frame_num = frame.get("frame")
-        try:
-            frame_i = int(frame_num)
-        except Exception:
+        frame_i = _safe_int(frame.get("frame"))
+        if frame_i is None:
             continue
         tracked = frame.get("tracked_objects")
         if not isinstance(tracked, list):
             continue
-        frame_map: Dict[str, Dict[str, Any]] = {}
-        for obj in tracked:
-            if not isinstance(obj, dict):
-                continue
-            obj_id = obj.get("id")
-            if not isinstance(obj_id, str) or not obj_id:
-                continue
-            frame_map[obj_id] = obj
+        frame_map = {
+            obj["id"]: obj
+            for obj in tracked
+            if isinstance(obj, dict) and isinstance(obj.get("id"), str) and obj["id"]
+        }
         if frame_map:
             index[frame_i] = frame_map
     return index
@@ -357,10 +643,8 @@ def _merge_reduced_tracking(
     for frame in frames:
         if not isinstance(frame, dict):
             continue
-        frame_num = frame.get("frame")
-        try:
-            frame_i = int(frame_num)
-        except Exception:
+        frame_i = _safe_int(frame.get("frame"))
+        if frame_i is None:
             continue
         supp_frame = supplemental_index.get(frame_i)
         if not supp_frame:
@@ -379,10 +663,13 @@ def _merge_reduced_tracking(
             if not supp_obj:
                 continue
 
+            obj_get = obj.get
+            supp_get = supp_obj.get
             for key in _TRACKING_ENRICH_FIELDS:
-                if (key not in obj) or (obj.get(key) is None):
-                    if supp_obj.get(key) is not None:
-                        obj[key] = supp_obj.get(key)
+                if obj_get(key) is None:
+                    value = supp_get(key)
+                    if value is not None:
+                        obj[key] = value
 
             base_speakers = obj.get("active_speakers")
             supp_speakers = supp_obj.get("active_speakers")
@@ -393,16 +680,8 @@ def _merge_reduced_tracking(
             ):
                 obj["active_speakers"] = supp_speakers
 
-    base_total = base_tracking.get("total_frames")
-    supp_total = supplemental_tracking.get("total_frames")
-    try:
-        base_total_i = int(base_total) if base_total is not None else None
-    except Exception:
-        base_total_i = None
-    try:
-        supp_total_i = int(supp_total) if supp_total is not None else None
-    except Exception:
-        supp_total_i = None
+    base_total_i = _safe_int(base_tracking.get("total_frames"))
+    supp_total_i = _safe_int(supplemental_tracking.get("total_frames"))
 
     if base_total_i is None and supp_total_i is not None:
         base_tracking["total_frames"] = supp_total_i
@@ -415,136 +694,392 @@ def _merge_reduced_tracking(
     return base_tracking
 
 
-def process_directory(base_path: str, keyword: str = "Camille"):
+def _wait_pending_writes(pending_writes: List[Tuple[Path, str, "Future[bool]"]]) -> bool:
+    all_written = True
+    for path, kind, future in pending_writes:
+        try:
+            if future.result():
+                logger.info("    - %s réduit avec succès: %s", kind, path.name)
+            else:
+                logger.info("    - %s déjà réduit (contenu identique, non réécrit): %s", kind, path.name)
+        except Exception as e:
+            all_written = False
+            logger.error("    - ERREUR : Impossible d'écrire '%s'. Erreur : %s", path.name, e)
+    pending_writes.clear()
+    return all_written
+
+
+def _load_reduction_cache(docs_path: Path) -> Dict[str, Any]:
+    try:
+        cache = _load_json(docs_path / REDUCTION_CACHE_NAME)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _reduction_fingerprint(
+    docs_path: Path,
+    video_stem: str,
+    pretty: bool,
+    schema_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Empreinte (mtime_ns, taille) des JSON associés à une vidéo, telle qu'après réduction.
+
+    Inclut le schéma de validation (chemin, mtime_ns, taille) : une exécution avec --validate,
+    ou avec un schéma modifié, ne réutilise pas une réduction non validée contre ce schéma.
+    """
+    files: Dict[str, List[int]] = {}
+    for name in (f"{video_stem}{TRACKING_SUFFIX}", f"{video_stem}.json", f"{video_stem}{AUDIO_SUFFIX}"):
+        try:
+            st = os.stat(docs_path / name)
+        except OSError:
+            continue
+        files[name] = [st.st_mtime_ns, st.st_size]
+    schema: Optional[List[Any]] = None
+    if schema_path:
+        try:
+            st = os.stat(schema_path)
+            schema = [schema_path, st.st_mtime_ns, st.st_size]
+        except OSError:
+            schema = [schema_path, None, None]
+    return {"pretty": pretty, "schema": schema, "files": files}
+
+
+def _finish_video_writes(
+    docs_path: Path,
+    video_path: Path,
+    writes: List[Tuple[Path, str, "Future[bool]"]],
+    cache: Dict[str, Any],
+    pretty: bool,
+    schema_path: Optional[str] = None,
+) -> bool:
+    """Attend les écritures d'une vidéo et l'inscrit dans le cache si elles ont réussi et incluent le tracking."""
+    tracking_written = any(kind == "Tracking" for _, kind, _ in writes)
+    if not _wait_pending_writes(writes) or not tracking_written:
+        return False
+    cache[video_path.name] = _reduction_fingerprint(docs_path, video_path.stem, pretty, schema_path)
+    return True
+
+
+def _print_item_progress(v_idx: int, total_videos: int, video_name: str) -> None:
+    print(f"INTERNAL_PROGRESS: {v_idx}/{total_videos} items ({int(round((v_idx / float(total_videos)) * 100))}%) - {video_name}", flush=True)
+
+
+class _VideoTarget(NamedTuple):
+    index: int
+    video_path: Path
+    tracking_in: Path
+    tracking_out: Path
+    tracking_fallback: Optional[Path]
+    audio_path: Path
+    audio_exists: bool
+
+
+def _plan_video_targets(
+    docs_path: Path,
+    docs_files: AbstractSet[str],
+    video_files: List[Path],
+) -> List[_VideoTarget]:
+    """Apparie toutes les vidéos à leurs JSON avant toute lecture (uniquement à partir du listing)."""
+    targets: List[_VideoTarget] = []
+    for v_idx, video_path in enumerate(video_files, start=1):
+        stem = video_path.stem
+        audio_path = docs_path / f"{stem}{AUDIO_SUFFIX}"
+        tracking_in, tracking_out, tracking_fallback = _resolve_tracking_paths(docs_path, stem, docs_files)
+        audio_exists = audio_path.name in docs_files
+
+        if tracking_in is None or tracking_out is None:
+            logger.warning("  - Tracking JSON introuvable pour '%s'.", video_path.name)
+            continue
+        if not audio_exists:
+            logger.warning("  - Fichier audio '%s' manquant pour '%s'.", audio_path.name, video_path.name)
+
+        targets.append(
+            _VideoTarget(v_idx, video_path, tracking_in, tracking_out, tracking_fallback, audio_path, audio_exists)
+        )
+    return targets
+
+
+def _process_video_pair(
+    target: _VideoTarget,
+    total_videos: int,
+    io_pool: ThreadPoolExecutor,
+    pending_writes: List[Tuple[Path, str, "Future[bool]"]],
+    pretty: bool = False,
+    schema_path: Optional[str] = None,
+) -> None:
+    video_path = target.video_path
+    tracking_in = target.tracking_in
+    tracking_out = target.tracking_out
+    tracking_fallback = target.tracking_fallback
+    audio_path = target.audio_path
+    stem = video_path.stem
+
+    logger.info(
+        "  - Cible: %s | tracking_in=%s | tracking_out=%s | audio=%s",
+        video_path.name,
+        tracking_in.name,
+        tracking_out.name,
+        audio_path.name,
+    )
+    _print_item_progress(target.index, total_videos, video_path.name)
+
+    # L'audio (indépendant du tracking) est lu et réduit en parallèle.
+    audio_future = io_pool.submit(_load_and_reduce_audio_json, audio_path) if target.audio_exists else None
+    try:
+        reduced_tracking = _load_and_reduce_video_json(tracking_in)
+        if reduced_tracking is None:
+            logger.warning("    - Tracking JSON ignoré (schéma inattendu): %s", tracking_in)
+            return
+
+        if (
+            tracking_fallback is not None
+            and tracking_in.resolve() != tracking_fallback.resolve()
+            and _reduced_tracking_needs_enrichment(reduced_tracking)
+        ):
+            try:
+                legacy_reduced = _load_and_reduce_video_json(tracking_fallback)
+                if legacy_reduced is not None:
+                    reduced_tracking = _merge_reduced_tracking(reduced_tracking, legacy_reduced)
+                    logger.info(
+                        "    - Tracking enrichi depuis legacy: %s -> %s",
+                        tracking_fallback.name,
+                        tracking_out.name,
+                    )
+            except Exception as e:
+                logger.warning(
+                    "    - Enrichissement legacy ignoré (erreur non bloquante) pour %s: %s",
+                    tracking_fallback.name,
+                    e,
+                )
+
+        reduced_audio = None
+        if audio_future is not None:
+            reduced_audio = audio_future.result()
+            if reduced_audio is None:
+                logger.warning("    - Audio JSON ignoré (schéma inattendu): %s", audio_path)
+            else:
+                pending_writes.append(
+                    (audio_path, "Audio", io_pool.submit(_write_json_if_changed, audio_path, reduced_audio, pretty))
+                )
+
+        temporal = _compute_temporal_alignment(reduced_tracking, reduced_audio)
+        if temporal:
+            reduced_tracking["temporal_alignment"] = temporal
+
+        if schema_path:
+            try:
+                _compiled_schema_validator(schema_path)(reduced_tracking)
+            except fastjsonschema.JsonSchemaException as e:
+                logger.error("    - ERREUR : Tracking réduit non conforme au schéma, non écrit (%s): %s", tracking_out.name, e)
+                return
+
+        pending_writes.append(
+            (tracking_out, "Tracking", io_pool.submit(_write_json_if_changed, tracking_out, reduced_tracking, pretty))
+        )
+
+        if temporal and temporal.get("warnings"):
+            logger.warning(
+                "    - Désalignement temporel détecté (%s): %s",
+                stem,
+                ", ".join([str(w) for w in temporal.get("warnings") or []]),
+            )
+
+    except json.JSONDecodeError as e:
+        logger.error("    - ERREUR : Impossible de lire un fichier JSON. Erreur : %s", e)
+    except Exception as e:
+        logger.error("    - ERREUR : Une erreur inattendue est survenue. Erreur : %s", e)
+    finally:
+        if audio_future is not None:
+            audio_future.cancel()
+
+
+def process_project_folder(
+    base: Path,
+    folder: str,
+    pretty: bool = False,
+    force: bool = False,
+    schema_path: Optional[str] = None,
+) -> None:
+    """
+    Réduit les JSON de tracking et audio du sous-dossier "docs" d'un projet.
+
+    Fonction de niveau module pour pouvoir être exécutée dans un ProcessPoolExecutor.
+    Pour chaque vidéo, l'audio est lu et réduit dans un thread pendant le tracking,
+    et les écritures se poursuivent en arrière-plan pendant la lecture suivante.
+    Les vidéos dont les JSON n'ont pas changé depuis la dernière réduction
+    (voir REDUCTION_CACHE_NAME) sont ignorées, sauf si force. Si schema_path est
+    fourni, chaque tracking réduit est validé (fastjsonschema) avant écriture.
+    """
+    docs_path = base / folder / "docs"
+
+    # Un seul listing de docs/ (qui vaut aussi test d'existence) : les tests de présence
+    # des JSON associés se font ensuite sur ce set.
+    try:
+        with os.scandir(docs_path) as entries:
+            docs_files = {e.name for e in entries if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning("-> Avertissement : Le dossier 'docs' est manquant dans '%s'.", folder)
+        return
+
+    logger.info("\n--- Traitement du dossier : %s ---", docs_path)
+    video_files = [
+        docs_path / name for name in sorted(docs_files)
+        if name.lower().endswith(VIDEO_EXTENSIONS)
+    ]
+    if not video_files:
+        logger.info("Aucune vidéo trouvée dans docs/.")
+        return
+
+    cache = _load_reduction_cache(docs_path)
+    cache_updated = False
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        previous: Optional[Tuple[Path, List[Tuple[Path, str, "Future[bool]"]]]] = None
+        try:
+            for target in _plan_video_targets(docs_path, docs_files, video_files):
+                video_path = target.video_path
+                if not force and cache.get(video_path.name) == _reduction_fingerprint(
+                    docs_path, video_path.stem, pretty, schema_path
+                ):
+                    logger.info("  - Déjà réduit (JSON inchangés), ignoré: %s", video_path.name)
+                    _print_item_progress(target.index, len(video_files), video_path.name)
+                    continue
+                current_writes: List[Tuple[Path, str, "Future[bool]"]] = []
+                _process_video_pair(target, len(video_files), io_pool, current_writes, pretty, schema_path)
+                # Les écritures de la vidéo précédente ont recouvert la lecture de celle-ci.
+                if previous is not None:
+                    cache_updated |= _finish_video_writes(docs_path, *previous, cache, pretty, schema_path)
+                previous = (video_path, current_writes)
+        finally:
+            if previous is not None:
+                cache_updated |= _finish_video_writes(docs_path, *previous, cache, pretty, schema_path)
+
+    if cache_updated:
+        try:
+            _write_json_atomically(docs_path / REDUCTION_CACHE_NAME, cache)
+        except OSError as e:
+            logger.warning("    - Cache de réduction non enregistré (%s): %s", REDUCTION_CACHE_NAME, e)
+
+    print(f"Succès: réduction JSON terminée pour {folder}", flush=True)
+
+
+def _init_worker_logging(log_queue) -> None:
+    """Redirige les logs d'un processus worker vers la file écoutée par le processus principal."""
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+
+def _project_json_bytes(base: Path, folder: str) -> int:
+    """Volume des JSON du dossier docs/ d'un projet, utilisé comme estimation de son coût."""
+    total = 0
+    try:
+        with os.scandir(base / folder / "docs") as entries:
+            for e in entries:
+                if e.name.endswith(".json") and e.name != REDUCTION_CACHE_NAME and e.is_file():
+                    total += e.stat().st_size
+    except OSError:
+        return 0
+    return total
+
+
+def _process_projects_in_pool(
+    base: Path,
+    project_folders: List[str],
+    max_workers: int,
+    pretty: bool = False,
+    force: bool = False,
+    schema_path: Optional[str] = None,
+) -> None:
+    total_projects = len(project_folders)
+    # Les workers héritent du tampon stdout : le vider évite des lignes de progression dupliquées.
+    sys.stdout.flush()
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, total_projects),
+            initializer=_init_worker_logging,
+            initargs=(log_queue,),
+        ) as pool:
+            # Les projets les plus lourds partent en premier : un gros projet soumis en dernier
+            # laisserait les autres workers inactifs en fin de traitement.
+            ordered = sorted(project_folders, key=lambda folder: _project_json_bytes(base, folder), reverse=True)
+            futures = {pool.submit(process_project_folder, base, folder, pretty, force, schema_path): folder for folder in ordered}
+            for idx, future in enumerate(as_completed(futures), start=1):
+                folder = futures[future]
+                print(f"REDUCING_JSON: {idx}/{total_projects}: {folder}", flush=True)
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("ERREUR : Échec du traitement du projet '%s'. Erreur : %s", folder, e)
+    finally:
+        listener.stop()
+
+
+def _list_project_folders(base: Path, keyword: str) -> List[str]:
+    # DirEntry.is_dir() s'appuie sur le type renvoyé par readdir : pas de stat par entrée.
+    with os.scandir(base) as entries:
+        return [e.name for e in entries if keyword in e.name and e.is_dir()]
+
+
+def process_directory(
+    base_path: str,
+    keyword: str = "Camille",
+    max_workers: int = 1,
+    pretty: bool = False,
+    force: bool = False,
+    schema_path: Optional[str] = None,
+    project_folders: Optional[List[str]] = None,
+):
     """
     Analyse les dossiers dans le chemin de base, recherche le mot-clé,
     et traite les paires de fichiers JSON trouvées dans les sous-dossiers "docs".
+
+    Avec max_workers > 1, les projets (indépendants) sont traités en parallèle
+    dans des processus séparés. Les JSON réduits sont compacts, sauf si pretty.
+    force retraite aussi les vidéos déjà réduites lors d'une exécution précédente.
+    schema_path (optionnel) désigne un JSON Schema auquel chaque tracking réduit doit se conformer.
+    project_folders évite un nouveau listing si l'appelant a déjà scanné base_path.
     """
     base = Path(base_path)
-    logger.info(f"Démarrage du scan dans : {base}")
+    logger.info("Démarrage du scan dans : %s", base)
     if not base.is_dir():
-        logger.error(f"Erreur : Le répertoire de base '{base_path}' n'existe pas.")
+        logger.error("Erreur : Le répertoire de base '%s' n'existe pas.", base_path)
         return
 
     # 1. Lister les dossiers de projet
-    project_folders = [
-        d.name
-        for d in base.iterdir()
-        if d.is_dir() and keyword in d.name
-    ]
+    if project_folders is None:
+        project_folders = _list_project_folders(base, keyword)
 
     if not project_folders:
         print(f"Aucun dossier contenant le mot-clé '{keyword}' n'a été trouvé.")
         return
 
-    logger.info(f"Dossiers de projet trouvés : {len(project_folders)}")
+    logger.info("Dossiers de projet trouvés : %s", len(project_folders))
 
     total_projects = len(project_folders)
-    for idx, folder in enumerate(project_folders, start=1):
-        print(f"REDUCING_JSON: {idx}/{total_projects}: {folder}")
-        docs_path = base / folder / "docs"
-
-        if not docs_path.is_dir():
-            logger.warning(f"-> Avertissement : Le dossier 'docs' est manquant dans '{folder}'.")
-            continue
-
-        logger.info(f"\n--- Traitement du dossier : {docs_path} ---")
-
-        video_files = [
-            p for p in docs_path.iterdir()
-            if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS
-        ]
-        if not video_files:
-            logger.info("Aucune vidéo trouvée dans docs/.")
-            continue
-
-        for v_idx, video_path in enumerate(video_files, start=1):
-            stem = video_path.stem
-            audio_path = docs_path / f"{stem}{AUDIO_SUFFIX}"
-            tracking_in, tracking_out, tracking_fallback = _resolve_tracking_paths(docs_path, stem)
+    if max_workers <= 1 or total_projects <= 1:
+        for idx, folder in enumerate(project_folders, start=1):
+            print(f"REDUCING_JSON: {idx}/{total_projects}: {folder}")
+            process_project_folder(base, folder, pretty, force, schema_path)
+    else:
+        _process_projects_in_pool(base, project_folders, max_workers, pretty, force, schema_path)
 
-            if tracking_in is None:
-                logger.warning(f"  - Tracking JSON introuvable pour '{video_path.name}'.")
-                continue
-            if not audio_path.exists():
-                logger.warning(f"  - Fichier audio '{audio_path.name}' manquant pour '{video_path.name}'.")
-
-            logger.info(
-                "  - Cible: %s | tracking_in=%s | tracking_out=%s | audio=%s",
-                video_path.name,
-                tracking_in.name,
-                tracking_out.name if tracking_out else "(none)",
-                audio_path.name,
-            )
-            print(f"INTERNAL_PROGRESS: {v_idx}/{len(video_files)} items ({int(round((v_idx / float(len(video_files))) * 100))}%) - {video_path.name}")
+    logger.info("\n--- Traitement terminé ! ---")
 
-            try:
-                with open(tracking_in, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
-
-                reduced_tracking = reduce_video_json(tracking_data)
-                if reduced_tracking is None:
-                    logger.warning(f"    - Tracking JSON ignoré (schéma inattendu): {tracking_in}")
-                else:
-                    assert tracking_out is not None
-
-                    if (
-                        tracking_fallback is not None
-                        and tracking_fallback.exists()
-                        and tracking_in.resolve() != tracking_fallback.resolve()
-                        and _reduced_tracking_needs_enrichment(reduced_tracking)
-                    ):
-                        try:
-                            with open(tracking_fallback, "r", encoding="utf-8") as f:
-                                legacy_tracking_data = json.load(f)
-                            legacy_reduced = reduce_video_json(legacy_tracking_data)
-                            if legacy_reduced is not None:
-                                reduced_tracking = _merge_reduced_tracking(reduced_tracking, legacy_reduced)
-                                logger.info(
-                                    "    - Tracking enrichi depuis legacy: %s -> %s",
-                                    tracking_fallback.name,
-                                    tracking_out.name,
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                "    - Enrichissement legacy ignoré (erreur non bloquante) pour %s: %s",
-                                tracking_fallback.name,
-                                e,
-                            )
-
-                    reduced_audio = None
-                    if audio_path.exists():
-                        with open(audio_path, "r", encoding="utf-8") as f:
-                            audio_data = json.load(f)
-                        reduced_audio = reduce_audio_json(audio_data)
-                        if reduced_audio is None:
-                            logger.warning(f"    - Audio JSON ignoré (schéma inattendu): {audio_path}")
-                        else:
-                            _write_json_atomically(audio_path, reduced_audio)
-                            logger.info("    - Audio réduit avec succès: %s", audio_path.name)
-
-                    temporal = _compute_temporal_alignment(reduced_tracking, reduced_audio)
-                    if temporal:
-                        reduced_tracking["temporal_alignment"] = temporal
-
-                    _write_json_atomically(tracking_out, reduced_tracking)
-                    logger.info("    - Tracking réduit avec succès: %s", tracking_out.name)
-
-                    if temporal and temporal.get("warnings"):
-                        logger.warning(
-                            "    - Désalignement temporel détecté (%s): %s",
-                            stem,
-                            ", ".join([str(w) for w in temporal.get("warnings") or []]),
-                        )
-
-            except json.JSONDecodeError as e:
-                logger.error(f"    - ERREUR : Impossible de lire un fichier JSON. Erreur : {e}")
-            except Exception as e:
-                logger.error(f"    - ERREUR : Une erreur inattendue est survenue. Erreur : {e}")
 
-        print(f"Succès: réduction JSON terminée pour {folder}")
+def _default_workers() -> int:
+    """STEP6_WORKERS si c'est un entier, sinon 1 (valeur vide ou invalide ignorée).
 
-    logger.info("\n--- Traitement terminé ! ---")
+    Séquentiel par défaut : en parallèle, les lignes REDUCING_JSON/INTERNAL_PROGRESS suivies
+    par l'interface arrivent dans l'ordre de complétion et s'entremêlent entre projets.
+    """
+    try:
+        return int(os.environ.get('STEP6_WORKERS', 1))
+    except ValueError:
+        return 1
 
 
 def main():
@@ -554,6 +1089,16 @@ def main():
     parser.add_argument('--keyword', type=str, default=os.environ.get('FOLDER_KEYWORD', 'Camille'), help='Mot-clé pour filtrer les dossiers projet')
     parser.add_argument('--log_dir', type=str, default=str(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'logs', 'step6')),
                         help='Répertoire pour les logs (par défaut logs/step6)')
+    parser.add_argument('--workers', type=int, default=_default_workers(),
+                        help='Nombre de projets traités en parallèle (1 = séquentiel, défaut ; ou STEP6_WORKERS)')
+    parser.add_argument('--pretty', action=argparse.BooleanOptionalAction,
+                        default=os.environ.get('JSON_REDUCER_PRETTY', '0') == '1',
+                        help='Écrit des JSON indentés (lisibles) au lieu de JSON compacts (défaut: JSON_REDUCER_PRETTY=1)')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Retraite toutes les vidéos, y compris celles marquées comme réduites dans {REDUCTION_CACHE_NAME}')
+
+    parser.add_argument('--validate', type=str, default=None, metavar='SCHEMA_JSON',
+                        help='Valide chaque tracking réduit contre ce JSON Schema (nécessite fastjsonschema)')
 
     args = parser.parse_args()
 
@@ -567,19 +1112,32 @@ def main():
     # Setup logging
     setup_logging(args.log_dir)
 
-    # Progress total: count candidate projects
+    if args.validate:
+        if fastjsonschema is None:
+            logger.error("--validate nécessite le paquet 'fastjsonschema', non installé.")
+            sys.exit(1)
+        try:
+            _compiled_schema_validator(os.path.abspath(args.validate))
+        except Exception as e:
+            logger.error("Schéma JSON invalide ou illisible (%s): %s", args.validate, e)
+            sys.exit(1)
+
+    # Progress total: count candidate projects (the listing is reused for processing)
+    projects = None
     try:
         if not os.path.isdir(work_dir):
-            logger.warning(f"Répertoire de travail introuvable: {work_dir}")
+            logger.warning("Répertoire de travail introuvable: %s", work_dir)
             print(f"TOTAL_JSON_TO_REDUCE: 0")
             sys.exit(0)
-        projects = [d for d in os.listdir(work_dir) if os.path.isdir(os.path.join(work_dir, d)) and args.keyword in d]
+        projects = _list_project_folders(Path(work_dir), args.keyword)
         print(f"TOTAL_JSON_TO_REDUCE: {len(projects)}")
     except Exception:
         print("TOTAL_JSON_TO_REDUCE: 0")
 
     # Run processing
-    process_directory(work_dir, keyword=args.keyword)
+    process_directory(work_dir, keyword=args.keyword, max_workers=args.workers, pretty=args.pretty, force=args.force,
+                      schema_path=os.path.abspath(args.validate) if args.validate else None,
+                      project_folders=projects)
 
 
 if __name__ == "__main__":
@@ -6,9 +6,13 @@ Script de finalisation et copie des projets vers la destination finale.
 Étape 7 (Ubuntu)
 \- Archive d'abord les artefacts d'analyse (scènes/tracking/audio) avant suppression
 \- Copie ensuite le dossier du projet vers la destination finale
+
+Variables d'environnement:
+\- FINALIZE_WORKERS: nombre de projets finalisés en parallèle (défaut 4, valeur invalide ignorée)
 """
 
 import os
+import re
 import errno
 import sys
 import json
@@ -16,8 +20,12 @@ import shutil
 import logging
 import subprocess
 import tempfile
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from typing import Iterator, Optional
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
@@ -32,9 +40,22 @@ WORK_DIR = Path(os.getcwd())
 OUTPUT_DIR = Path(os.environ.get("OUTPUT_DIR", "/mnt/cache"))
 # --- FIN DE LA MODIFICATION ---
 FINALIZE_MODE = os.environ.get("FINALIZE_MODE", "lenient").lower()
+# Nombre de projets finalisés en parallèle (copie/suppression limitées par les I/O).
+# Valeur vide ou non numérique: repli sur 4 plutôt qu'une erreur à l'import.
+try:
+    FINALIZE_WORKERS = max(1, int(os.environ.get("FINALIZE_WORKERS", "4")))
+except ValueError:
+    FINALIZE_WORKERS = 4
 BASE_DIR = ROOT_DIR
 LOG_DIR = BASE_DIR / "logs" / "step7"
 
+# Fichiers regroupés sous docs/ à la finalisation
+_VIDEO_EXTS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+_MEDIA_EXTS = _VIDEO_EXTS | {".png", ".jpg", ".jpeg"}
+_ANALYSIS_SUFFIXES = (SCENES_SUFFIX, AUDIO_SUFFIX, TRACKING_SUFFIX)
+# Manifeste de cache de l'étape 6 (json_reducer.REDUCTION_CACHE_NAME) : non livré
+STEP6_CACHE_NAME = ".json_reducer_cache.json"
+
 # --- Configuration du Logger ---
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 log_file = LOG_DIR / f"finalize_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -49,24 +70,72 @@ logging.basicConfig(
 )
 
 
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Parcourt récursivement `root` avec os.scandir et produit les entrées de type fichier.
+
+    Le type vient du dirent (pas de stat par entrée, sauf pour les liens symboliques).
+    Comme Path.rglob, les liens vers des dossiers ne sont pas suivis; les dossiers illisibles sont ignorés.
+    """
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _index_project_artifacts(project_dir: Path, first_video_only: bool = False) -> dict[str, dict[str, Path]]:
+    """Parcourt une seule fois l'arborescence d'un projet et indexe vidéos et artefacts par stem.
+
+    Retourne un dict `{".mp4" | SUFFIX: {stem: chemin}}`; le premier fichier rencontré
+    pour un stem donné est conservé. Les liens symboliques vers des dossiers ne sont pas suivis.
+    Avec `first_video_only`, le parcours s'arrête à la première vidéo et les artefacts ne sont pas indexés.
+    """
+    index: dict[str, dict[str, Path]] = {
+        ".mp4": {}, SCENES_SUFFIX: {}, TRACKING_SUFFIX: {}, AUDIO_SUFFIX: {},
+    }
+    artifact_suffixes = (SCENES_SUFFIX, TRACKING_SUFFIX, AUDIO_SUFFIX)
+    for entry in _iter_files(project_dir):
+        name = entry.name
+        if name.endswith(".mp4"):
+            index[".mp4"].setdefault(name[:-4], Path(entry.path))
+            if first_video_only:
+                break
+            continue
+        if first_video_only:
+            continue
+        for suffix in artifact_suffixes:
+            if name.endswith(suffix):
+                index[suffix].setdefault(name[:-len(suffix)], Path(entry.path))
+                break
+    return index
+
+
 def find_projects_to_finalize():
     """Trouve tous les projets dans WORK_DIR qui sont prêts à être finalisés."""
     projects = []
     logging.info(f"Recherche de projets à finaliser dans: {WORK_DIR}")
 
-    for project_dir in WORK_DIR.iterdir():
-        if not project_dir.is_dir() or project_dir.name.startswith("_temp_"):
-            continue
+    with os.scandir(WORK_DIR) as it:
+        project_dirs = [Path(e.path) for e in it if e.is_dir() and not e.name.startswith("_temp_")]
+
+    for project_dir in project_dirs:
 
         is_ready = False
         found_reason = ""
-        for video_file in project_dir.rglob("*.mp4"):
-            stem = video_file.stem
-            scenes_csv = next(project_dir.rglob(f"{stem}{SCENES_SUFFIX}"), None)
-            tracking_json = next(project_dir.rglob(f"{stem}{TRACKING_SUFFIX}"), None)
-            audio_json = next(project_dir.rglob(f"{stem}{AUDIO_SUFFIX}"), None)
+        # Mode "videos": une seule vidéo suffit, inutile d'indexer le reste de l'arborescence
+        artifacts = _index_project_artifacts(project_dir, first_video_only=FINALIZE_MODE == "videos")
+        scenes = artifacts[SCENES_SUFFIX]
+        tracking = artifacts[TRACKING_SUFFIX]
+        audio = artifacts[AUDIO_SUFFIX]
+        for stem, video_file in artifacts[".mp4"].items():
             if FINALIZE_MODE == "strict":
-                if scenes_csv and scenes_csv.exists() and tracking_json and tracking_json.exists():
+                if stem in scenes and stem in tracking:
                     found_reason = f"artefacts scènes+tracking pour '{video_file.name}'"
                     is_ready = True
                     break
@@ -75,7 +144,7 @@ def find_projects_to_finalize():
                 is_ready = True
                 break
             else:
-                if (scenes_csv and scenes_csv.exists()) or (tracking_json and tracking_json.exists()) or (audio_json and audio_json.exists()):
+                if stem in scenes or stem in tracking or stem in audio:
                     found_reason = f"au moins un artefact pour '{video_file.name}'"
                     is_ready = True
                     break
@@ -93,9 +162,19 @@ def _is_dir_writable(path: Path) -> bool:
     """Teste la capacité d'écriture/suppression dans un répertoire cible.
 
     Plus fiable que os.access() sur des montages FUSE/NTFS.
+    Sous Linux, un fichier anonyme O_TMPFILE sert de pré-test: un refus net (montage RO,
+    permissions) conclut sans créer de fichier. Sinon, un fichier temporaire nommé est créé
+    puis supprimé, comme le fera la finalisation.
     """
     try:
         path.mkdir(parents=True, exist_ok=True)
+        if _O_TMPFILE:
+            try:
+                os.close(os.open(str(path), _O_TMPFILE | os.O_WRONLY, 0o600))
+            except OSError as e:
+                # Autres erreurs (O_TMPFILE non supporté, FUSE/NTFS souvent): test nommé seul
+                if e.errno in (errno.EROFS, errno.EACCES):
+                    return False
         with tempfile.NamedTemporaryFile(dir=str(path), delete=True) as tmp:
             tmp.write(b"writable-check")
             tmp.flush()
@@ -135,50 +214,254 @@ def _select_output_dir(preferred: Path, base_dir: Path) -> Path:
     return local_fb
 
 
+# Chemins des outils externes (rsync/cp), résolus une seule fois par exécution
+_TOOL_PATHS: dict[str, Optional[str]] = {}
+# Support de chmod par périphérique de destination (clé: st_dev)
+_CHMOD_SUPPORT_CACHE: dict[int, bool] = {}
+# Types de FS montés connus pour refuser chmod (NTFS/FAT/SMB): inutile de les sonder
+_NO_CHMOD_FSTYPES = frozenset({"fuseblk", "ntfs", "ntfs3", "cifs", "exfat", "vfat"})
+_MOUNTINFO_PATH = "/proc/self/mountinfo"
+# Fichier anonyme pour les tests d'écriture (Linux uniquement; 0 = indisponible)
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+# Copie Python de repli: taille des blocs read/write et erreurs signifiant
+# "méthode noyau non supportée ici" (on passe alors à la méthode suivante)
+_COPY_BUFFER_SIZE = 1024 * 1024
+# Nombre de fichiers à partir duquel _safe_rmtree passe par `rm -rf`
+_RMTREE_SUBPROCESS_MIN_FILES = 32
+# Copies parallèles lors de la restauration des analyses archivées
+_RESTORE_WORKERS = 8
+# En dessous de cette taille, l'appel posix_fadvise coûte plus qu'il ne libère
+_PAGE_CACHE_DROP_MIN_BYTES = 1024 * 1024
+_FAST_COPY_FALLBACK_ERRNOS = frozenset(
+    e for e in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, getattr(errno, "ENOTSUP", None))
+    if e is not None
+)
+
+
+def _which_cached(tool: str) -> Optional[str]:
+    """Retourne `shutil.which(tool)` en mémorisant le résultat pour les appels suivants."""
+    if tool not in _TOOL_PATHS:
+        _TOOL_PATHS[tool] = shutil.which(tool)
+    return _TOOL_PATHS[tool]
+
+
 def _safe_rmtree(path: Path) -> None:
-    """Supprime un dossier en consignant proprement les erreurs de permissions."""
+    """Supprime un dossier en consignant proprement les erreurs de permissions.
+
+    Au-delà de quelques dizaines de fichiers, délègue à `rm -rf` (bien plus rapide que
+    shutil.rmtree); en cas d'échec, shutil.rmtree termine et journalise chaque erreur.
+    """
+    # Comptage borné: on s'arrête dès que le seuil est atteint
+    sampled_files = sum(1 for _ in itertools.islice(_iter_files(path), _RMTREE_SUBPROCESS_MIN_FILES))
+    if sampled_files >= _RMTREE_SUBPROCESS_MIN_FILES and _which_cached("rm"):
+        try:
+            subprocess.run(["rm", "-rf", "--", str(path)], check=True)
+            return
+        except (OSError, subprocess.CalledProcessError) as e:
+            logging.warning(f"rm -rf a échoué sur '{path}': {e}; repli sur shutil.rmtree")
+            if not os.path.lexists(path):
+                return
+
     def _onerror(func, p, exc_info):
         logging.error(f"Suppression échouée sur '{p}': {exc_info[1]}")
     shutil.rmtree(path, onerror=_onerror)
 
 
+@functools.lru_cache(maxsize=1)
+def _read_mount_fstypes() -> dict[str, str]:
+    """Lit /proc/self/mountinfo une fois: {point de montage: type de FS}. Vide hors Linux."""
+    mounts: dict[str, str] = {}
+    try:
+        with open(_MOUNTINFO_PATH, "r", encoding="utf-8", errors="surrogateescape") as f:
+            for line in f:
+                fields = line.split()
+                try:
+                    sep = fields.index("-", 6)
+                    mountpoint = re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[4])
+                    # Les montages ultérieurs masquent les précédents sur le même point
+                    mounts[mountpoint] = fields[sep + 1]
+                except (ValueError, IndexError):
+                    continue
+    except OSError:
+        pass
+    return mounts
+
+
+def _mount_fstype(path: Path) -> Optional[str]:
+    """Type de FS du montage le plus spécifique contenant `path`, ou None s'il est inconnu."""
+    mounts = _read_mount_fstypes()
+    if not mounts:
+        return None
+    current = path.resolve()
+    for candidate in (current, *current.parents):
+        fstype = mounts.get(str(candidate))
+        if fstype is not None:
+            return fstype
+    return None
+
+
 def _destination_supports_chmod(dest_dir: Path) -> bool:
     """Détecte si le FS destination supporte chmod (NTFS typiquement renvoie EPERM).
     
     Si on ne peut pas créer de fichier, la question du chmod est secondaire; laisser True.
+    Le résultat est mémorisé par périphérique (`st_dev`): un seul test par montage et par exécution.
+    Les montages NTFS/FAT/SMB connus (d'après /proc/self/mountinfo) sont refusés sans test.
     """
     try:
         dest_dir.mkdir(parents=True, exist_ok=True)
+        device = os.stat(dest_dir).st_dev
+        cached = _CHMOD_SUPPORT_CACHE.get(device)
+        if cached is not None:
+            return cached
+        if _mount_fstype(dest_dir) in _NO_CHMOD_FSTYPES:
+            _CHMOD_SUPPORT_CACHE[device] = False
+            return False
         with tempfile.NamedTemporaryFile(dir=str(dest_dir), delete=True) as tmp:
             try:
                 os.chmod(tmp.name, 0o664)
+                supported = True
             except PermissionError:
-                return False
+                supported = False
             except OSError as e:
                 err = getattr(e, 'errno', None)
-                if err in (errno.EPERM, errno.EACCES, getattr(errno, 'EOPNOTSUPP', None)):
-                    return False
-                raise
+                if err not in (errno.EPERM, errno.EACCES, getattr(errno, 'EOPNOTSUPP', None)):
+                    raise
+                supported = False
     except Exception:
         return True
+    _CHMOD_SUPPORT_CACHE[device] = supported
+    return supported
+
+
+def _copy_fd_contents(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copie le contenu de `src_fd` vers `dst_fd` depuis leurs positions courantes.
+
+    Ordre: copy_file_range (copie noyau, reflink possible), puis sendfile, puis boucle read/write.
+    Chaque méthode avance les positions des deux descripteurs: la suivante reprend là où
+    la précédente s'est arrêtée si le FS la refuse.
+    """
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+    if copied < size and hasattr(os, "sendfile"):
+        try:
+            while copied < size:
+                n = os.sendfile(dst_fd, src_fd, None, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+    while True:
+        chunk = os.read(src_fd, _COPY_BUFFER_SIZE)
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """posix_fadvise sur tout le fichier, ignoré si la plateforme ou le FS ne le supporte pas."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _fast_copy(src, dst, src_dir_fd: Optional[int] = None, dst_dir_fd: Optional[int] = None) -> None:
+    """Copie le contenu d'un fichier (sans métadonnées, comme shutil.copyfile) au plus près du noyau.
+
+    `src_dir_fd`/`dst_dir_fd` permettent de passer des noms relatifs à des dossiers déjà ouverts.
+    """
+    src_fd = os.open(src, os.O_RDONLY, dir_fd=src_dir_fd)
+    try:
+        size = os.fstat(src_fd).st_size
+        # Lecture séquentielle: readahead agressif pendant la copie
+        _fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dst_dir_fd)
+        try:
+            _copy_fd_contents(src_fd, dst_fd, size)
+        finally:
+            os.close(dst_fd)
+        # La source sera supprimée après la copie du projet: inutile de garder ses pages en cache
+        _fadvise(src_fd, "POSIX_FADV_DONTNEED")
+    finally:
+        os.close(src_fd)
+
+
+def _drop_page_cache(root: Path) -> None:
+    """Demande au noyau d'évincer du page cache les gros fichiers (>= 1 Mio) copiés sous `root`.
+
+    Best effort: ignoré hors Linux (pas de posix_fadvise) et sur toute erreur d'ouverture.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    for entry in _iter_files(root):
+        try:
+            if entry.is_symlink() or entry.stat().st_size < _PAGE_CACHE_DROP_MIN_BYTES:
+                continue
+            try:
+                fd = os.open(entry.path, flags)
+            except PermissionError:
+                # O_NOATIME exige d'être propriétaire du fichier
+                fd = os.open(entry.path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
 
 
 def _copy_project_tree(src: Path, dst: Path) -> None:
     """Copie le projet sans préserver les permissions sur FS type NTFS.
 
     Stratégie:
-    - Si chmod supporté: utiliser shutil.copytree (comportement standard).
+    - Si chmod supporté: rsync -aL (récursif, conserve permissions/dates, et copie le contenu
+      des liens symboliques comme shutil.copytree) en --inplace --whole-file; à défaut
+      cp -aL --reflink=auto (copie CoW sur btrfs/xfs); en dernier recours shutil.copytree.
     - Sinon: tenter rsync --no-perms/owner/group; à défaut cp --no-preserve; à défaut copie Python manuelle.
     """
     dst.parent.mkdir(parents=True, exist_ok=True)
     supports_chmod = _destination_supports_chmod(dst)
     if supports_chmod:
+        if _which_cached("rsync"):
+            try:
+                subprocess.run([
+                    "rsync", "-aL", "--inplace", "--whole-file",
+                    f"{str(src)}/", f"{str(dst)}/"
+                ], check=True)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"rsync a échoué: {e}")
+        if _which_cached("cp"):
+            try:
+                subprocess.run(["cp", "-aL", "--reflink=auto", "-T", str(src), str(dst)], check=True)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"cp -aL a échoué: {e}")
         shutil.copytree(src, dst, dirs_exist_ok=True)
         return
 
     logging.info("Destination ne supporte pas chmod — copie sans préservation des permissions.")
     # 1) rsync si disponible
     try:
+        if not _which_cached("rsync"):
+            raise FileNotFoundError("rsync")
         subprocess.run([
             "rsync", "-a", "--no-perms", "--no-owner", "--no-group", "--no-times",
             f"{str(src)}/", f"{str(dst)}/"
@@ -200,17 +483,23 @@ def _copy_project_tree(src: Path, dst: Path) -> None:
     except subprocess.CalledProcessError as e:
         logging.warning(f"cp --no-preserve a échoué: {e}")
 
-    # 3) Fallback Python: os.walk et shutil.copyfile sans copystat
-    for root, dirs, files in os.walk(src):
+    # 3) Fallback Python: os.fwalk et _fast_copy (contenu seul, sans copystat). Les fichiers sont
+    # ouverts relativement aux descripteurs des dossiers source/destination: pas de résolution
+    # du chemin complet à chaque fichier.
+    for root, dirs, files, root_fd in os.fwalk(src):
         rel = os.path.relpath(root, src)
         target_dir = dst / rel if rel != "." else dst
         target_dir.mkdir(parents=True, exist_ok=True)
         for d in dirs:
             (target_dir / d).mkdir(parents=True, exist_ok=True)
-        for f in files:
-            s = Path(root) / f
-            t = target_dir / f
-            shutil.copyfile(s, t)
+        if not files:
+            continue
+        target_fd = os.open(target_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for f in files:
+                _fast_copy(f, f, src_dir_fd=root_fd, dst_dir_fd=target_fd)
+        finally:
+            os.close(target_fd)
 
 
 def _compute_alternative_output_dir(existing_dst: Path) -> Path:
@@ -229,6 +518,14 @@ def _compute_alternative_output_dir(existing_dst: Path) -> Path:
     return candidate
 
 
+def _split_name(name: str) -> tuple[str, str]:
+    """Découpe un nom de fichier en (stem, extension), comme Path.stem/Path.suffix sans créer de Path."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ""
+
+
 def _normalize_project_docs_structure(dst_project_dir: Path) -> None:
     """Ensure destination project has a docs/ subfolder containing media and related files.
 
@@ -238,46 +535,51 @@ def _normalize_project_docs_structure(dst_project_dir: Path) -> None:
     docs_dir = dst_project_dir / "docs"
     docs_dir.mkdir(parents=True, exist_ok=True)
 
-    media_exts = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".png", ".jpg", ".jpeg"}
-    analysis_suffixes = {SCENES_SUFFIX, AUDIO_SUFFIX, TRACKING_SUFFIX}
+    # Un seul listage de la racine: les fichiers servent à la fois aux stems vidéo et aux déplacements
+    with os.scandir(dst_project_dir) as it:
+        root_files = [(e.name, *_split_name(e.name)) for e in it if e.name != "docs" and e.is_file()]
+
+    video_stems: set[str] = {stem for _, stem, ext in root_files if ext.lower() in _VIDEO_EXTS}
+    # Vidéos déjà rangées sous docs/ (sous-dossiers compris, comme restore_archived_analysis)
+    for e in _iter_files(docs_dir):
+        stem, ext = _split_name(e.name)
+        if ext.lower() in _VIDEO_EXTS:
+            video_stems.add(stem)
+
+    for name, stem, raw_ext in root_files:
+        ext = raw_ext.lower()
+        # `name == stem + ".csv"` équivaut à une extension ".csv" exacte
+        move = (
+            ext in _MEDIA_EXTS
+            or name.endswith(_ANALYSIS_SUFFIXES)
+            or raw_ext == ".csv"
+            or (ext == ".json" and stem in video_stems)
+        )
+        if move:
+            entry = dst_project_dir / name
+            target = docs_dir / name
+            try:
+                # Même système de fichiers (tout est sous dst_project_dir): rename atomique qui écrase la cible
+                os.replace(entry, target)
+            except Exception as e:
+                logging.warning(f"Impossible de déplacer '{entry}' vers '{target}': {e}")
+
 
-    video_exts = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
-    video_stems: set[str] = set()
+def _remove_step6_cache_manifest(dst_project_dir: Path) -> None:
+    """Supprime de la destination le manifeste de cache de l'étape 6 (utile seulement aux relances)."""
     try:
-        for p in dst_project_dir.iterdir():
-            if p.is_file() and p.suffix.lower() in video_exts:
-                video_stems.add(p.stem)
-        if docs_dir.exists():
-            for p in docs_dir.rglob("*"):
-                if p.is_file() and p.suffix.lower() in video_exts:
-                    video_stems.add(p.stem)
-    except Exception:
+        (dst_project_dir / "docs" / STEP6_CACHE_NAME).unlink()
+    except FileNotFoundError:
         pass
+    except OSError as e:
+        logging.warning(f"Impossible de supprimer '{STEP6_CACHE_NAME}' de '{dst_project_dir}': {e}")
 
-    for entry in dst_project_dir.iterdir():
-        if entry.name == "docs":
-            continue
-        if entry.is_file():
-            ext = entry.suffix.lower()
-            stem = entry.stem
-            move = False
-            if ext in media_exts:
-                move = True
-            else:
-                for suf in analysis_suffixes:
-                    if entry.name.endswith(suf) or entry.name == f"{stem}.csv":
-                        move = True
-                        break
-                if not move and ext == ".json" and stem in video_stems:
-                    move = True
-            if move:
-                target = docs_dir / entry.name
-                try:
-                    if target.exists():
-                        target.unlink()
-                    shutil.move(str(entry), str(target))
-                except Exception as e:
-                    logging.warning(f"Impossible de déplacer '{entry}' vers '{target}': {e}")
+
+def _copy_file_with_times(src: Path, dst: Path) -> None:
+    """Copie le contenu puis les dates d'accès/modification, sans le chmod de shutil.copystat."""
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 
 def restore_archived_analysis(project_name: str, output_project_dir: Path) -> None:
@@ -290,41 +592,91 @@ def restore_archived_analysis(project_name: str, output_project_dir: Path) -> No
         docs_dir = output_project_dir / "docs"
         docs_dir.mkdir(parents=True, exist_ok=True)
 
-        video_exts = (".mp4", ".mov", ".avi", ".mkv", ".webm")
         videos = []
         if docs_dir.exists():
-            videos.extend([p for p in docs_dir.rglob("*") if p.is_file() and p.suffix.lower() in video_exts])
-        videos.extend([p for p in output_project_dir.iterdir() if p.is_file() and p.suffix.lower() in video_exts])
-
+            videos.extend(Path(e.path) for e in _iter_files(docs_dir) if _split_name(e.name)[1].lower() in _VIDEO_EXTS)
+        with os.scandir(output_project_dir) as it:
+            videos.extend(Path(e.path) for e in it if e.is_file() and _split_name(e.name)[1].lower() in _VIDEO_EXTS)
+
+        # Toutes les vidéos (docs/ ou racine) reçoivent leurs analyses dans docs/
+        artifacts = (("scenes", SCENES_SUFFIX), ("audio", AUDIO_SUFFIX), ("tracking", TRACKING_SUFFIX))
+        # Une seule copie par destination: deux vidéos de même stem (sous-dossiers différents de
+        # docs/) visent le même fichier. Comme en séquentiel, la dernière vidéo listée l'emporte.
+        copies: dict[Path, tuple[str, Path]] = {}
         for v in videos:
-            target_dir = docs_dir if v.parent != docs_dir else v.parent
             stem = v.stem
-
-            scenes_path = ResultsArchiver.find_analysis_file(project_name, v, SCENES_SUFFIX)
-            if scenes_path:
-                dst = target_dir / f"{stem}{SCENES_SUFFIX}"
+            archived = ResultsArchiver.find_analysis_files(project_name, v, [suffix for _, suffix in artifacts])
+            for label, suffix in artifacts:
+                archived_path = archived.get(suffix)
+                if archived_path:
+                    copies[docs_dir / f"{stem}{suffix}"] = (label, archived_path)
+
+        if not copies:
+            return
+        # Petits fichiers indépendants: copies en parallèle, échecs journalisés un par un
+        with ThreadPoolExecutor(max_workers=min(_RESTORE_WORKERS, len(copies))) as executor:
+            futures = {
+                executor.submit(_copy_file_with_times, src, dst): (label, src, dst)
+                for dst, (label, src) in copies.items()
+            }
+            for future in as_completed(futures):
+                label, src, dst = futures[future]
                 try:
-                    shutil.copy2(scenes_path, dst)
+                    future.result()
                 except Exception as e:
-                    logging.warning(f"Restauration scenes échouée {scenes_path} -> {dst}: {e}")
+                    logging.warning(f"Restauration {label} échouée {src} -> {dst}: {e}")
+    except Exception as e:
+        logging.warning(f"Restauration des analyses archivées échouée (projet={project_name}): {e}")
 
-            audio_path = ResultsArchiver.find_analysis_file(project_name, v, AUDIO_SUFFIX)
-            if audio_path:
-                dst = target_dir / f"{stem}{AUDIO_SUFFIX}"
-                try:
-                    shutil.copy2(audio_path, dst)
-                except Exception as e:
-                    logging.warning(f"Restauration audio échouée {audio_path} -> {dst}: {e}")
 
-            tracking_path = ResultsArchiver.find_analysis_file(project_name, v, TRACKING_SUFFIX)
-            if tracking_path:
-                dst = target_dir / f"{stem}{TRACKING_SUFFIX}"
-                try:
-                    shutil.copy2(tracking_path, dst)
-                except Exception as e:
-                    logging.warning(f"Restauration tracking échouée {tracking_path} -> {dst}: {e}")
+def _is_under_archives_dir(path: Path) -> bool:
+    """Indique si `path` se trouve sous ARCHIVES_DIR (source à ne jamais supprimer ni déplacer)."""
+    try:
+        path.resolve().relative_to(config.ARCHIVES_DIR.resolve())
+        return True
+    except Exception:
+        return False
+
+
+def _can_rename_project_dir(src: Path, dst: Path) -> bool:
+    """Indique si `src` peut être déplacé vers `dst` par un simple rename.
+
+    Faux si `dst` existe déjà ou si la source et le parent de `dst` sont sur des périphériques différents.
+    """
+    try:
+        return not dst.exists() and os.stat(src).st_dev == os.stat(dst.parent).st_dev
+    except OSError:
+        return False
+
+
+def _move_project_dir(src: Path, dst: Path) -> bool:
+    """Déplace `src` vers `dst` par rename (voir `_can_rename_project_dir`).
+
+    Retourne False (sans rien modifier) si le rename échoue (EXDEV, permissions...):
+    l'appelant repasse alors par copie + suppression.
+    """
+    try:
+        os.rename(src, dst)
+        return True
+    except OSError as e:
+        logging.info(f"Rename impossible '{src}' -> '{dst}' ({e}); repli sur copie + suppression.")
+        return False
+
+
+def _archive_project_analysis(project_name: str) -> None:
+    """Archive les artefacts d'analyse du projet source (scènes/tracking/audio) et journalise le résultat."""
+    try:
+        arch_summary = ResultsArchiver.archive_project_analysis(project_name)
+        if arch_summary and not arch_summary.get("error"):
+            logging.info(
+                "Archivage des analyses terminé: %s",
+                json.dumps({k: arch_summary.get(k) for k in ("processed", "copied")}, ensure_ascii=False)
+            )
+        else:
+            logging.warning(f"Archivage des analyses non effectué ou en erreur: {arch_summary}")
     except Exception as e:
-        logging.warning(f"Restauration des analyses archivées échouée (projet={project_name}): {e}")
+        logging.warning(f"Erreur lors de l'archivage des analyses du projet '{project_name}': {e}")
+
 
 def finalize_project(project_dir):
     """Copie un projet vers la destination finale et supprime la source."""
@@ -333,18 +685,11 @@ def finalize_project(project_dir):
         logging.info(f"Finalisation du projet: {project_name}")
         print(f"Finalisation en cours pour '{project_name}'...")
 
-        # 1) Archiver d'abord tous les artefacts d'analyse disponibles
-        try:
-            arch_summary = ResultsArchiver.archive_project_analysis(project_name)
-            if arch_summary and not arch_summary.get("error"):
-                logging.info(
-                    "Archivage des analyses terminé: %s",
-                    json.dumps({k: arch_summary.get(k) for k in ("processed", "copied")}, ensure_ascii=False)
-                )
-            else:
-                logging.warning(f"Archivage des analyses non effectué ou en erreur: {arch_summary}")
-        except Exception as e:
-            logging.warning(f"Erreur lors de l'archivage des analyses du projet '{project_name}': {e}")
+        # 1) Archiver les artefacts d'analyse en arrière-plan, pendant la copie: l'archivage
+        # ne fait que lire la source, qui reste en place jusqu'à la fin de celui-ci.
+        archive_pool = ThreadPoolExecutor(max_workers=1)
+        archive_future = archive_pool.submit(_archive_project_analysis, project_name)
+        archive_pool.shutdown(wait=False)
 
         output_project_dir = OUTPUT_DIR / project_name
 
@@ -360,14 +705,28 @@ def finalize_project(project_dir):
                 )
                 output_project_dir = alt_dir
 
-        try:
-            _copy_project_tree(project_dir, output_project_dir)
-        except Exception as e:
-            logging.error("Erreur lors de la copie du projet: %s", e, exc_info=True)
-            raise
-        logging.info(f"Projet '{project_name}' copié avec succès vers '{output_project_dir}'")
+        under_archives = _is_under_archives_dir(project_dir)
+        moved = False
+        if not under_archives and _can_rename_project_dir(project_dir, output_project_dir):
+            # Le rename fait disparaître la source: l'archivage doit être terminé avant
+            archive_future.result()
+            moved = _move_project_dir(project_dir, output_project_dir)
+        if moved:
+            logging.info(f"Projet '{project_name}' déplacé (rename) vers '{output_project_dir}'")
+        else:
+            try:
+                _copy_project_tree(project_dir, output_project_dir)
+            except Exception as e:
+                logging.error("Erreur lors de la copie du projet: %s", e, exc_info=True)
+                raise
+            logging.info(f"Projet '{project_name}' copié avec succès vers '{output_project_dir}'")
+            _drop_page_cache(output_project_dir)
+
+        # Restauration et suppression de la source exigent un archivage terminé
+        archive_future.result()
 
         _normalize_project_docs_structure(output_project_dir)
+        _remove_step6_cache_manifest(output_project_dir)
 
         if os.environ.get("RESTORE_ARCHIVES_TO_OUTPUT", "0") in ("1", "true", "True"):
             try:
@@ -376,14 +735,12 @@ def finalize_project(project_dir):
                 logging.warning(f"Restauration des analyses archivées échouée: {e}")
 
         # --- Suppression du dossier source (après archivage) ---
-        try:
-            project_dir.resolve().relative_to(config.ARCHIVES_DIR.resolve())
+        if under_archives:
             logging.error(f"Refus de suppression: '{project_dir}' est sous ARCHIVES_DIR")
             return False
-        except Exception:
-            pass
-        _safe_rmtree(project_dir)
-        logging.info(f"Dossier source '{project_dir}' supprimé avec succès.")
+        if not moved:
+            _safe_rmtree(project_dir)
+            logging.info(f"Dossier source '{project_dir}' supprimé avec succès.")
         # --- FIN suppression ---
 
         # --- MODIFICATION: Suppression de la création du fichier metadata_final.json ---
@@ -421,10 +778,11 @@ def main():
         logging.info("Aucun projet à finaliser. Fin du script.")
         return
 
-    successful_count = 0
-    for project in projects:
-        if finalize_project(project):
-            successful_count += 1
+    # Chaque projet a son propre dossier de destination: aucune contention entre workers.
+    max_workers = min(FINALIZE_WORKERS, total_projects)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(finalize_project, project) for project in projects]
+        successful_count = sum(1 for future in as_completed(futures) if future.result())
 
     logging.info(f"--- Finalisation terminée ---")
     logging.info(f"Résumé: {successful_count}/{total_projects} projet(s) finalisé(s) et déplacé(s) avec succès.")